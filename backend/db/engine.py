@@ -9,6 +9,7 @@ import os
 from pathlib import Path
 from typing import Generator
 
+from sqlalchemy import text
 from sqlmodel import SQLModel, Session, create_engine
 
 
@@ -26,6 +27,15 @@ DATABASE_URL = os.getenv(
 # Data root for file paths (relative paths are resolved against this)
 DATA_ROOT = Path(os.getenv("DATA_ROOT", "./data"))
 
+# Connection pool sizing (API server, worker and SSE streams share one pool
+# per process). Recycle connections before server-side idle timeouts hit.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # seconds
+
+# LISTEN/NOTIFY channel the Gemini queue worker waits on for new jobs
+JOB_NOTIFY_CHANNEL = "processing_jobs"
+
 
 # =============================================================================
 # ENGINE SETUP
@@ -34,11 +44,13 @@ DATA_ROOT = Path(os.getenv("DATA_ROOT", "./data"))
 # Create engine with connection pooling
 # pool_size: number of connections to keep open
 # max_overflow: number of additional connections allowed beyond pool_size
+# pool_recycle: replace connections older than this many seconds
 engine = create_engine(
     DATABASE_URL,
     echo=False,  # Set True for SQL debugging
-    pool_size=5,
-    max_overflow=10,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_recycle=DB_POOL_RECYCLE,
     pool_pre_ping=True,  # Verify connections before use
 )
 
@@ -58,6 +70,17 @@ def get_session() -> Generator[Session, None, None]:
         yield session
 
 
+def notify_jobs_queued(session: Session) -> None:
+    """
+    Signal the queue worker that new ProcessingJobs were added.
+    
+    Call before session.commit(): Postgres delivers NOTIFY only when the
+    transaction commits, so the worker never wakes before the jobs are
+    visible.
+    """
+    session.execute(text(f"NOTIFY {JOB_NOTIFY_CHANNEL}"))
+
+
 def create_db_and_tables() -> None:
     """
     Create all tables defined in models.py.
@@ -17,6 +17,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional, List
 
+from sqlalchemy import Column, Computed, Float, Index, text
 from sqlmodel import SQLModel, Field, Relationship
 
 
@@ -135,6 +136,10 @@ class Chunk(SQLModel, table=True):
     Path: audio_path is RELATIVE (e.g., "chunks/video_101/chunk_000.wav").
     """
     __tablename__ = "chunks"
+    __table_args__ = (
+        # Chunks are always listed/navigated per video in chunk order
+        Index("ix_chunks_video_id_chunk_index", "video_id", "chunk_index"),
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     video_id: int = Field(foreign_key="videos.id")
@@ -174,6 +179,16 @@ class Segment(SQLModel, table=True):
         AbsoluteTime = (ChunkIndex * 300) + RelativeTime
     """
     __tablename__ = "segments"
+    __table_args__ = (
+        # Segments are always fetched per chunk ordered by start time
+        Index("ix_segments_chunk_id_start_time", "chunk_id", "start_time_relative"),
+        # Verified-hours aggregates sum duration over verified segments only
+        Index(
+            "ix_segments_verified_duration",
+            "duration",
+            postgresql_where=text("is_verified"),
+        ),
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     chunk_id: int = Field(foreign_key="chunks.id")
@@ -184,6 +199,15 @@ class Segment(SQLModel, table=True):
     start_time_relative: float = Field(ge=0.0)
     end_time_relative: float = Field(ge=0.0)
     
+    # Generated by the database (end - start); never written by the app
+    duration: Optional[float] = Field(
+        default=None,
+        sa_column=Column(
+            Float,
+            Computed("end_time_relative - start_time_relative", persisted=True),
+        ),
+    )
+    
     # The Content
     transcript: str  # Original code-switched text
     translation: str  # Vietnamese translation
@@ -28,6 +28,10 @@ logger = logging.getLogger(__name__)
 # CONFIGURATION
 # =============================================================================
 
+# Extensions a download may end up with, in lookup preference order
+AUDIO_EXTENSIONS = ['m4a', 'mp3', 'wav', 'opus', 'webm', 'mp4']
+
+
 def get_yt_dlp_config(output_dir: Path, video_id: str) -> Dict[str, Any]:
     """
     Get strict yt-dlp configuration for Vietnamese audio.
@@ -148,20 +152,34 @@ def fetch_metadata(url: str) -> Optional[VideoMetadata]:
             if not info:
                 return None
             
-            return VideoMetadata(
-                video_id=info.get('id', ''),
-                title=info.get('title', 'Unknown'),
-                duration_seconds=int(info.get('duration', 0)),
-                channel_name=info.get('channel', info.get('uploader', 'Unknown')),
-                channel_url=info.get('channel_url', ''),
-                original_url=info.get('webpage_url', url),
-            )
+            return _metadata_from_info(info, url)
             
     except Exception as e:
         logger.error(f"Failed to fetch metadata: {e}")
         return None
 
 
+def _metadata_from_info(info: Dict[str, Any], url: str) -> VideoMetadata:
+    """
+    Build VideoMetadata from a single-video yt-dlp info dict.
+    
+    Args:
+        info: Info dict returned by extract_info for one video
+        url: URL that was requested (fallback for webpage_url)
+        
+    Returns:
+        VideoMetadata without file_path
+    """
+    return VideoMetadata(
+        video_id=info.get('id', ''),
+        title=info.get('title', 'Unknown'),
+        duration_seconds=int(info.get('duration', 0)),
+        channel_name=info.get('channel', info.get('uploader', 'Unknown')),
+        channel_url=info.get('channel_url', ''),
+        original_url=info.get('webpage_url', url),
+    )
+
+
 def _build_video_url(video_id: str) -> str:
     """
     Build a full YouTube watch URL from a video ID.
@@ -224,11 +242,10 @@ def fetch_playlist_metadata(url: str) -> List[VideoMetadata]:
                 ''
             )
             
-            # Single video
+            # Single video: extract_flat only affects playlist entries, so
+            # this info is already complete - no second extraction needed
             if 'entries' not in info:
-                meta = fetch_metadata(url)
-                if meta:
-                    results.append(meta)
+                results.append(_metadata_from_info(info, url))
             else:
                 # Playlist/channel
                 for entry in info.get('entries', []):
@@ -265,6 +282,48 @@ def fetch_playlist_metadata(url: str) -> List[VideoMetadata]:
     return results
 
 
+def _find_downloaded_file(
+    info: Dict[str, Any],
+    output_dir: Path,
+    video_ids: List[str]
+) -> Optional[Path]:
+    """
+    Locate the audio file yt-dlp produced.
+    
+    Uses the final filepath yt-dlp records in requested_downloads (updated
+    by the FFmpegExtractAudio postprocessor). Falls back to one directory
+    scan matching <video_id>.<audio ext>, in extension preference order.
+    
+    Args:
+        info: Info dict returned by extract_info(download=True)
+        output_dir: Download directory
+        video_ids: Candidate IDs used in the filename, in priority order
+        
+    Returns:
+        Path to the downloaded file, or None if not found
+    """
+    for download in info.get('requested_downloads') or []:
+        filepath = download.get('filepath')
+        if filepath and os.path.isfile(filepath):
+            return Path(filepath)
+    
+    # Fallback: single scandir pass instead of probing every id/ext pair
+    wanted = {f"{vid}.{ext}" for vid in video_ids for ext in AUDIO_EXTENSIONS}
+    found = {}
+    with os.scandir(output_dir) as entries:
+        for entry in entries:
+            if entry.name in wanted and entry.is_file():
+                found[entry.name] = entry.path
+    
+    for vid in video_ids:
+        for ext in AUDIO_EXTENSIONS:
+            name = f"{vid}.{ext}"
+            if name in found:
+                return Path(found[name])
+    
+    return None
+
+
 def download_audio(
     url: str,
     output_dir: Path,
@@ -336,18 +395,9 @@ def download_audio(
             # yt-dlp might use the actual video ID from info, not our extracted one
             actual_video_id = info.get('id', video_id)
             
-            file_path = None
-            # Try both our extracted ID and the actual ID from yt-dlp
-            for vid in [actual_video_id, video_id]:
-                for ext in ['m4a', 'mp3', 'wav', 'opus', 'webm', 'mp4']:
-                    candidate = output_dir / f"{vid}.{ext}"
-                    if candidate.exists():
-                        file_path = candidate
-                        break
-                if file_path:
-                    break
+            file_path = _find_downloaded_file(info, output_dir, [actual_video_id, video_id])
             
-            if not file_path or not file_path.exists():
+            if not file_path:
                 logger.error(f"Download completed but file not found for {url}")
                 logger.error(f"  Searched for: {actual_video_id}.* and {video_id}.* in {output_dir}")
                 return None
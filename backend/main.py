@@ -109,11 +109,28 @@ app.include_router(export.router, prefix="/api", tags=["Export"])
 # STATIC FILES (Audio Serving)
 # =============================================================================
 
+# Seconds browsers may reuse a served audio file before revalidating (ETag)
+STATIC_CACHE_MAX_AGE = int(os.getenv("STATIC_CACHE_MAX_AGE", "3600"))
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that lets the browser cache responses.
+    
+    Re-opening a chunk in the Workbench then reuses the cached WAV instead of
+    downloading it again; after max-age the ETag makes it a cheap 304.
+    """
+    
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = f"private, max-age={STATIC_CACHE_MAX_AGE}"
+        return response
+
+
 # Mount data directory for audio file access
 # Files served at: /api/static/{relative_path}
 # Example: /api/static/chunks/video_1/chunk_000.wav
 if DATA_ROOT.exists():
-    app.mount("/api/static", StaticFiles(directory=str(DATA_ROOT)), name="static")
+    app.mount("/api/static", CachedStaticFiles(directory=str(DATA_ROOT)), name="static")
 
 
 # =============================================================================
@@ -23,6 +23,7 @@ Usage:
 
 import csv
 import logging
+import os
 from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
@@ -51,8 +52,9 @@ CHANNELS = 1          # Mono
 
 EXPORT_DIR = DATA_ROOT / "export"
 
-# Default parallelism level
-DEFAULT_WORKERS = 8
+# Default parallelism level: one worker per core, capped at 8 (past that the
+# clip writes contend on disk rather than scale). Override with EXPORT_WORKERS.
+DEFAULT_WORKERS = int(os.getenv("EXPORT_WORKERS", str(min(os.cpu_count() or 4, 8))))
 
 
 # =============================================================================
@@ -105,7 +107,7 @@ class ChunkCache:
         
         data, sr = sf.read(full_path, dtype='int16')
         self.data[chunk_path] = (data, sr)
-        logger.debug(f"Cached chunk: {chunk_path} ({len(data)/sr:.1f}s)")
+        logger.debug("Cached chunk: %s (%.1fs)", chunk_path, len(data) / sr)
         return data, sr
     
     def clear(self) -> None:
@@ -202,33 +204,41 @@ def collect_segments_for_video(
         return [], {}
     
     chunk_paths: Dict[int, str] = {c.id: c.audio_path for c in chunks}
-    segments: List[ExportedSegment] = []
-    
-    for chunk in chunks:
-        # Query segments with:
-        # 1. is_rejected == False (exclude rejected segments)
-        # 2. start_time_relative < 300 (guillotine rule)
-        chunk_segments = session.exec(
-            select(Segment)
-            .where(Segment.chunk_id == chunk.id)
-            .where(Segment.is_rejected == False)  # noqa: E712
-            .where(Segment.start_time_relative < CHUNK_DURATION)
-            .order_by(Segment.start_time_relative)
-        ).all()
-        
-        for seg in chunk_segments:
-            exported = ExportedSegment(
-                segment_id=seg.id,
-                video_id=video_id,
-                chunk_id=chunk.id,
-                chunk_audio_path=chunk.audio_path,
-                start_time_relative=seg.start_time_relative,
-                end_time_relative=seg.end_time_relative,
-                duration=seg.end_time_relative - seg.start_time_relative,
-                transcript=seg.transcript,
-                translation=seg.translation,
-            )
-            segments.append(exported)
+    
+    # One query across all approved chunks, fetching only the exported columns:
+    # 1. is_rejected == False (exclude rejected segments)
+    # 2. start_time_relative < 300 (guillotine rule)
+    rows = session.exec(
+        select(
+            Segment.id,
+            Segment.chunk_id,
+            Segment.start_time_relative,
+            Segment.end_time_relative,
+            Segment.duration,
+            Segment.transcript,
+            Segment.translation,
+        )
+        .join(Chunk, Segment.chunk_id == Chunk.id)
+        .where(Chunk.id.in_(chunk_paths.keys()))
+        .where(Segment.is_rejected == False)  # noqa: E712
+        .where(Segment.start_time_relative < CHUNK_DURATION)
+        .order_by(Chunk.chunk_index, Segment.start_time_relative)
+    ).all()
+    
+    segments = [
+        ExportedSegment(
+            segment_id=segment_id,
+            video_id=video_id,
+            chunk_id=chunk_id,
+            chunk_audio_path=chunk_paths[chunk_id],
+            start_time_relative=start,
+            end_time_relative=end,
+            duration=duration,
+            transcript=transcript,
+            translation=translation,
+        )
+        for segment_id, chunk_id, start, end, duration, transcript, translation in rows
+    ]
     
     return segments, chunk_paths
 
@@ -308,14 +318,22 @@ def export_video(
     if cache is None:
         cache = _chunk_cache
     
-    # Pre-load all chunks into RAM (the speed magic happens here)
+    # Pre-load all chunks into RAM (the speed magic happens here).
+    # Reads run concurrently: libsndfile releases the GIL during file I/O
+    # and decoding, so cold-cache disk latency overlaps across chunks.
     if not dry_run:
-        for chunk_id, chunk_path in chunk_paths.items():
+        def preload(chunk_path: str) -> None:
             full_path = DATA_ROOT / chunk_path
-            if full_path.exists():
+            # Just try the read; only stat the path to classify a failure
+            try:
                 cache.load(chunk_path, full_path)
-            else:
+            except RuntimeError:
+                if full_path.exists():
+                    raise  # Present but unreadable: surface it as before
                 logger.warning(f"Chunk file missing: {chunk_path}")
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(preload, chunk_paths.values()))
     
     # Prepare output paths
     video_export_dir = EXPORT_DIR / f"video_{video_id}"
@@ -369,7 +387,11 @@ def write_manifest(segments: List[ExportedSegment], output_path: Path) -> None:
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_path, 'w', newline='', encoding='utf-8') as f:
+    # Write to a sibling temp file and rename into place, so training jobs
+    # never read a half-written manifest. No fsync: the manifest is fully
+    # regenerable from the database, so crash durability isn't worth the stall.
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    with open(tmp_path, 'w', newline='', encoding='utf-8') as f:
         writer = csv.writer(f, delimiter='\t')
         
         # Header
@@ -388,6 +410,7 @@ def write_manifest(segments: List[ExportedSegment], output_path: Path) -> None:
                 seg.transcript,
                 seg.translation,
             ])
+    os.replace(tmp_path, output_path)
     
     logger.info(f"Wrote manifest: {output_path} ({len(segments)} entries)")
 
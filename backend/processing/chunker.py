@@ -12,13 +12,16 @@ Algorithm:
 The 5-second overlap is handled during export (stitching algorithm).
 """
 
+import os
 import subprocess
 import logging
 import platform
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Tuple, Optional
 
+import soundfile as sf
 from sqlmodel import Session
 
 from backend.db.engine import get_session, DATA_ROOT, engine
@@ -37,6 +40,13 @@ OVERLAP = 5           # 5 second overlap
 SAMPLE_RATE = 16000   # 16kHz (standard for ASR)
 CHANNELS = 1          # Mono
 
+# Parallel FFmpeg processes per video
+CHUNK_WORKERS = int(os.getenv("CHUNK_WORKERS", "4"))
+
+# Kill an FFmpeg/ffprobe call that runs longer than this (a healthy chunk
+# extraction takes seconds; a wedged one would otherwise block a worker forever)
+FFMPEG_TIMEOUT_SECONDS = int(os.getenv("FFMPEG_TIMEOUT_SECONDS", "300"))
+
 # Windows needs full path for executables in subprocess
 IS_WINDOWS = platform.system() == "Windows"
 
@@ -62,6 +72,18 @@ def _find_executable(name: str) -> str:
 FFPROBE = _find_executable("ffprobe")
 FFMPEG = _find_executable("ffmpeg")
 
+# Fixed parts of the chunk extraction command, built once at import
+# -hide_banner/-nostats/-loglevel error: stderr carries only real errors,
+# not the banner and a progress line per frame that we'd buffer and drop
+# -ac 1: Mono
+# -ar 16000: 16kHz sample rate
+FFMPEG_EXTRACT_PREFIX = (FFMPEG, "-y", "-hide_banner", "-nostats", "-loglevel", "error")
+FFMPEG_EXTRACT_OUTPUT = (
+    "-ac", str(CHANNELS),
+    "-ar", str(SAMPLE_RATE),
+    "-acodec", "pcm_s16le",  # 16-bit PCM
+)
+
 
 # =============================================================================
 # HELPER FUNCTIONS
@@ -69,10 +91,12 @@ FFMPEG = _find_executable("ffmpeg")
 
 def get_audio_duration(file_path: Path) -> float:
     """
-    Get audio duration using ffmpeg (fallback from ffprobe).
+    Get audio duration from the container header.
     
-    Uses ffmpeg with -i to read metadata and extracts duration from stderr.
-    Works even when ffprobe is not installed.
+    Tries soundfile first (WAV/FLAC/OGG/MP3), which only reads the header,
+    then ffprobe's format=duration for other containers (m4a/webm). Falls
+    back to ffmpeg -i without an output when ffprobe is not installed, so
+    ffmpeg prints the metadata and exits instead of decoding the whole file.
     
     Args:
         file_path: Path to audio file
@@ -85,15 +109,41 @@ def get_audio_duration(file_path: Path) -> float:
     """
     import re
     
+    try:
+        info = sf.info(str(file_path))
+        if info.samplerate > 0 and info.frames > 0:
+            return info.frames / info.samplerate
+    except RuntimeError:
+        pass  # Container not supported by libsndfile (e.g. m4a/webm)
+    
+    try:
+        result = subprocess.run(
+            [
+                FFPROBE, "-v", "error",
+                "-show_entries", "format=duration",
+                "-of", "default=noprint_wrappers=1:nokey=1",
+                str(file_path)
+            ],
+            capture_output=True,
+            text=True,
+            timeout=FFMPEG_TIMEOUT_SECONDS
+        )
+        if result.returncode == 0:
+            return float(result.stdout.strip())
+    except (OSError, ValueError, subprocess.TimeoutExpired):
+        pass  # ffprobe missing, printed N/A or hung
+    
+    # No output file: ffmpeg reads the header, prints it and exits non-zero
     cmd = [
         FFMPEG,
         "-i", str(file_path),
-        "-f", "null",
-        "-"
     ]
     
     # ffmpeg writes metadata to stderr, so we need to capture it
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=FFMPEG_TIMEOUT_SECONDS)
+    except subprocess.TimeoutExpired:
+        raise RuntimeError(f"ffmpeg timed out after {FFMPEG_TIMEOUT_SECONDS}s reading {file_path}")
     
     # Look for Duration: HH:MM:SS.ms in stderr
     duration_match = re.search(
@@ -141,6 +191,51 @@ def calculate_chunk_ranges(total_duration: float) -> List[Tuple[float, float]]:
     return ranges
 
 
+def extract_chunk(
+    input_path: Path,
+    chunk_index: int,
+    start_time: float,
+    chunk_duration: float,
+    output_path: Path
+) -> None:
+    """
+    Extract one chunk with FFmpeg.
+    
+    Args:
+        input_path: Source audio file
+        chunk_index: Index of the chunk (for logging)
+        start_time: Chunk start in seconds
+        chunk_duration: Chunk length in seconds
+        output_path: Destination WAV file
+        
+    Raises:
+        RuntimeError: If FFmpeg fails or exceeds FFMPEG_TIMEOUT_SECONDS
+    """
+    # FFmpeg command
+    # -ss before -i: Input seeking (jumps to start instead of decoding up to it)
+    # -t: Duration
+    cmd = [
+        *FFMPEG_EXTRACT_PREFIX,
+        "-ss", str(start_time),
+        "-i", str(input_path),
+        "-t", str(chunk_duration),
+        *FFMPEG_EXTRACT_OUTPUT,
+        str(output_path)
+    ]
+    
+    logger.info(f"  Chunk {chunk_index}: {start_time:.1f}s - {start_time + chunk_duration:.1f}s")
+    
+    # Output stays as bytes; it's only decoded if we actually log it
+    try:
+        result = subprocess.run(cmd, capture_output=True, timeout=FFMPEG_TIMEOUT_SECONDS)
+    except subprocess.TimeoutExpired:
+        raise RuntimeError(f"FFmpeg timed out after {FFMPEG_TIMEOUT_SECONDS}s for chunk {chunk_index}")
+    
+    if result.returncode != 0:
+        logger.error(f"FFmpeg failed: {result.stderr.decode('utf-8', errors='replace')}")
+        raise RuntimeError(f"FFmpeg failed for chunk {chunk_index}")
+
+
 # =============================================================================
 # MAIN CHUNKING FUNCTION
 # =============================================================================
@@ -199,43 +294,28 @@ def chunk_video(video_id: int, session: Optional[Session] = None) -> int:
             logger.warning(f"Video {video_id} already has {len(existing)} chunks, skipping")
             return 0
         
-        # Process each chunk
-        chunks_created = 0
-        
+        # Process chunks in parallel; each is an independent ffmpeg process
+        jobs = []
         for chunk_index, (start_time, chunk_duration) in enumerate(ranges):
             output_filename = f"chunk_{chunk_index:03d}.wav"
-            output_path = output_dir / output_filename
-            relative_path = f"chunks/video_{video_id}/{output_filename}"
-            
-            # FFmpeg command
-            # -ss: Start time
-            # -t: Duration
-            # -ac 1: Mono
-            # -ar 16000: 16kHz sample rate
-            cmd = [
-                FFMPEG, "-y",
-                "-i", str(input_path),
-                "-ss", str(start_time),
-                "-t", str(chunk_duration),
-                "-ac", str(CHANNELS),
-                "-ar", str(SAMPLE_RATE),
-                "-acodec", "pcm_s16le",  # 16-bit PCM
-                str(output_path)
+            jobs.append((chunk_index, start_time, chunk_duration, output_dir / output_filename))
+        
+        with ThreadPoolExecutor(max_workers=CHUNK_WORKERS) as executor:
+            futures = [
+                executor.submit(extract_chunk, input_path, *job)
+                for job in jobs
             ]
-            
-            logger.info(f"  Chunk {chunk_index}: {start_time:.1f}s - {start_time + chunk_duration:.1f}s")
-            
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode != 0:
-                logger.error(f"FFmpeg failed: {result.stderr}")
-                raise RuntimeError(f"FFmpeg failed for chunk {chunk_index}")
-            
-            # Create database record
+            for future in futures:
+                future.result()  # Re-raise the first FFmpeg failure
+        
+        # Create database records in chunk order
+        chunks_created = 0
+        
+        for chunk_index, _, _, output_path in jobs:
             chunk = Chunk(
                 video_id=video_id,
                 chunk_index=chunk_index,
-                audio_path=relative_path,
+                audio_path=f"chunks/video_{video_id}/{output_path.name}",
                 status=ProcessingStatus.PENDING,
             )
             session.add(chunk)
@@ -20,7 +20,12 @@ import os
 import re
 import json
 import time
+import random
+import signal
+import selectors
+import threading
 import logging
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
@@ -30,9 +35,10 @@ from dotenv import load_dotenv
 load_dotenv()
 
 import google.generativeai as genai
+from sqlalchemy import delete, insert
 from sqlmodel import Session, select
 
-from backend.db.engine import engine, DATA_ROOT
+from backend.db.engine import engine, DATA_ROOT, JOB_NOTIFY_CHANNEL
 from backend.db.models import Chunk, Segment, ProcessingStatus, ProcessingJob, JobStatus
 from backend.utils.time_parser import parse_timestamp
 
@@ -282,7 +288,42 @@ class ModelKeyManager:
     
     def configure_genai(self, key: str) -> None:
         """Configure genai library with the given API key."""
+        configure_genai_key(key)
+
+
+# =============================================================================
+# GEMINI CLIENT CACHE
+# =============================================================================
+
+# Built once; identical for every request
+GENERATION_CONFIG = genai.GenerationConfig(
+    response_mime_type="application/json",
+    response_schema=RESPONSE_SCHEMA  # Enforce structure
+)
+
+_configured_key: Optional[str] = None
+
+
+def configure_genai_key(key: str) -> None:
+    """Point the global genai client at key, skipping the call if it already is."""
+    global _configured_key
+    if key != _configured_key:
         genai.configure(api_key=key)
+        _configured_key = key
+
+
+@lru_cache(maxsize=16)
+def get_generative_model(model_name: str, api_key: str) -> genai.GenerativeModel:
+    """
+    Return a GenerativeModel reused across chunks.
+    
+    Keyed by api_key too: a model binds the client of whichever key was
+    configured on its first request, so rotation must yield a fresh one.
+    """
+    return genai.GenerativeModel(
+        model_name=model_name,
+        system_instruction=SYSTEM_PROMPT  # Set system instruction at model level
+    )
 
 
 # =============================================================================
@@ -316,14 +357,19 @@ def parse_gemini_response(text: str) -> List[Dict[str, Any]]:
     Raises:
         ValueError: If parsing fails
     """
-    cleaned = clean_json_response(text)
-    
+    # Fast path: with response_mime_type=application/json the text is usually
+    # plain JSON already, so only run the markdown-stripping regexes on failure
     try:
-        data = json.loads(cleaned)
-    except json.JSONDecodeError as e:
-        logger.error(f"JSON parse error: {e}")
-        logger.error(f"Raw text: {cleaned[:500]}")
-        raise ValueError(f"Invalid JSON response: {e}")
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        cleaned = clean_json_response(text)
+        
+        try:
+            data = json.loads(cleaned)
+        except json.JSONDecodeError as e:
+            logger.error(f"JSON parse error: {e}")
+            logger.error(f"Raw text: {cleaned[:500]}")
+            raise ValueError(f"Invalid JSON response: {e}")
     
     if not isinstance(data, list):
         raise ValueError(f"Expected list, got {type(data).__name__}")
@@ -392,12 +438,10 @@ def process_chunk(
         session.add(chunk)
         session.commit()
         
-        # Configure Gemini
-        genai.configure(api_key=api_key_pool.get_key())
-        model = genai.GenerativeModel(
-            model_name=model_name,
-            system_instruction=SYSTEM_PROMPT  # Set system instruction at model level
-        )
+        # Configure Gemini (no-op unless the key rotated since the last chunk)
+        api_key = api_key_pool.get_key()
+        configure_genai_key(api_key)
+        model = get_generative_model(model_name, api_key)
         
         # Upload and process
         logger.info(f"Processing chunk {chunk_id}: {chunk.audio_path}")
@@ -410,10 +454,7 @@ def process_chunk(
             # Generate transcription with structured output
             response = model.generate_content(
                 [USER_PROMPT, audio_file],
-                generation_config=genai.GenerationConfig(
-                    response_mime_type="application/json",
-                    response_schema=RESPONSE_SCHEMA  # Enforce structure
-                )
+                generation_config=GENERATION_CONFIG
             )
             
             processing_time = time.time() - start_time
@@ -421,24 +462,27 @@ def process_chunk(
             # Parse response
             segments_data = parse_gemini_response(response.text)
             
-            # Delete existing segments for this chunk
-            existing = session.exec(
-                select(Segment).where(Segment.chunk_id == chunk_id)
-            ).all()
-            for seg in existing:
-                session.delete(seg)
+            # Replace existing segments for this chunk: one DELETE statement
+            # and one executemany INSERT instead of per-row ORM operations
+            session.execute(delete(Segment).where(Segment.chunk_id == chunk_id))
             
-            # Insert new segments
-            for seg_data in segments_data:
-                segment = Segment(
-                    chunk_id=chunk_id,
-                    start_time_relative=seg_data["start"],
-                    end_time_relative=seg_data["end"],
-                    transcript=seg_data["text"],
-                    translation=seg_data["translation"],
-                    is_verified=False,
-                )
-                session.add(segment)
+            now = datetime.utcnow()
+            rows = [
+                {
+                    "chunk_id": chunk_id,
+                    "start_time_relative": seg_data["start"],
+                    "end_time_relative": seg_data["end"],
+                    "transcript": seg_data["text"],
+                    "translation": seg_data["translation"],
+                    "is_verified": False,
+                    "is_rejected": False,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for seg_data in segments_data
+            ]
+            if rows:
+                session.execute(insert(Segment), rows)
             
             # Update chunk status
             chunk.status = ProcessingStatus.REVIEW_READY
@@ -512,6 +556,70 @@ def process_all_pending(
 # QUEUE WORKER (Centralized Processing)
 # =============================================================================
 
+# Set to cut the idle poll wait short: by the job listener when the API
+# NOTIFYs that jobs were queued, or manually via `kill -USR1 <worker pid>`.
+# The worker otherwise re-polls every poll_interval.
+_wake_event = threading.Event()
+
+# Ceiling for the exponential backoff after consecutive worker-loop errors
+# (e.g. database unreachable), so an outage isn't retried every poll_interval
+WORKER_MAX_BACKOFF_SECONDS = 300
+
+# Random extra delay added to each backoff so several workers sharing a
+# database or API key don't all retry in lockstep after an outage
+WORKER_BACKOFF_JITTER_SECONDS = 15
+
+
+def wake_worker(*_args) -> None:
+    """Wake an idle queue worker immediately. Usable as a signal handler."""
+    _wake_event.set()
+
+
+# How long the job listener waits for a notification before pinging its
+# connection, so a silently dropped connection is noticed and replaced
+JOB_LISTEN_TIMEOUT_SECONDS = 60
+
+
+def _listen_for_jobs() -> None:
+    """
+    Wake the worker whenever the API NOTIFYs JOB_NOTIFY_CHANNEL.
+    
+    Runs forever in a daemon thread on its own connection (detached from
+    the pool). On connection errors it reconnects after a pause; meanwhile
+    the worker still polls every poll_interval.
+    """
+    while True:
+        conn = None
+        try:
+            raw_conn = engine.raw_connection()
+            raw_conn.detach()
+            conn = raw_conn.dbapi_connection
+            conn.autocommit = True
+            with conn.cursor() as cursor:
+                cursor.execute(f"LISTEN {JOB_NOTIFY_CHANNEL}")
+            logger.info(f"Listening for queued jobs on '{JOB_NOTIFY_CHANNEL}'")
+            
+            with selectors.DefaultSelector() as selector:
+                selector.register(conn, selectors.EVENT_READ)
+                while True:
+                    if not selector.select(JOB_LISTEN_TIMEOUT_SECONDS):
+                        with conn.cursor() as cursor:
+                            cursor.execute("SELECT 1")
+                        continue
+                    conn.poll()
+                    if conn.notifies:
+                        conn.notifies.clear()
+                        _wake_event.set()
+        except Exception as e:
+            logger.warning(f"Job listener disconnected, retrying in 30s: {e}")
+            if conn is not None:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+            time.sleep(30)
+
+
 def run_queue_worker(
     poll_interval: float = 2.0,
     rate_limit_delay: float = 1.0,
@@ -560,6 +668,15 @@ def run_queue_worker(
     key_pool = SmartKeyPool()
     key_pool.set_key(current_key)
     
+    # SIGUSR1 doesn't exist on Windows; there the worker just polls
+    if hasattr(signal, "SIGUSR1"):
+        signal.signal(signal.SIGUSR1, wake_worker)
+    
+    # Pick up newly queued jobs immediately instead of at the next poll
+    threading.Thread(target=_listen_for_jobs, name="job-listener", daemon=True).start()
+    
+    consecutive_errors = 0
+    
     while True:
         try:
             with Session(engine) as session:
@@ -572,10 +689,14 @@ def run_queue_worker(
                     .with_for_update(skip_locked=True)
                 ).first()
                 
+                # Queue reachable again: drop any error backoff
+                consecutive_errors = 0
+                
                 if not job:
                     # No jobs in queue, sleep and retry
                     logger.debug("Queue empty, waiting...")
-                    time.sleep(poll_interval)
+                    _wake_event.wait(poll_interval)
+                    _wake_event.clear()
                     continue
                 
                 # Claim the job
@@ -648,8 +769,12 @@ def run_queue_worker(
             logger.info("\nQueue worker stopped by user (Ctrl+C)")
             break
         except Exception as e:
-            logger.error(f"Worker error: {e}")
-            time.sleep(poll_interval)
+            consecutive_errors += 1
+            backoff = min(poll_interval * 2 ** min(consecutive_errors - 1, 8), WORKER_MAX_BACKOFF_SECONDS)
+            backoff += random.uniform(0, WORKER_BACKOFF_JITTER_SECONDS)
+            logger.error(f"Worker error ({consecutive_errors} in a row, retrying in {backoff:.0f}s): {e}")
+            _wake_event.wait(backoff)
+            _wake_event.clear()
 
 
 # =============================================================================
@@ -94,6 +94,32 @@ def clear_expired_lock(chunk: Chunk) -> None:
         chunk.lock_expires_at = None
 
 
+def build_chunk_detail(chunk: Chunk, session: Session) -> ChunkDetailResponse:
+    """
+    Attach video title and sibling chunk count to a chunk.
+    
+    Both come from one query; the count is done in SQL rather than by
+    loading every Chunk row of the video.
+    """
+    from sqlalchemy import func
+    
+    row = session.exec(
+        select(
+            Video.title,
+            select(func.count(Chunk.id))
+            .where(Chunk.video_id == chunk.video_id)
+            .scalar_subquery(),
+        ).where(Video.id == chunk.video_id)
+    ).first()
+    video_title, total_chunks = row if row else ("Unknown", 0)
+    
+    return ChunkDetailResponse(
+        **chunk.model_dump(),
+        video_title=video_title,
+        total_chunks=total_chunks
+    )
+
+
 # =============================================================================
 # ENDPOINTS
 # =============================================================================
@@ -205,16 +231,7 @@ def get_next_chunk(
     existing = session.exec(existing_stmt).first()
     
     if existing:
-        video = session.get(Video, existing.video_id)
-        total = session.exec(
-            select(Chunk).where(Chunk.video_id == existing.video_id)
-        ).all()
-        
-        return ChunkDetailResponse(
-            **existing.model_dump(),
-            video_title=video.title if video else "Unknown",
-            total_chunks=len(total)
-        )
+        return build_chunk_detail(existing, session)
     
     # 2. Find next available chunk
     # Status is REVIEW_READY or IN_REVIEW (for resuming), and Lock is NULL (or expired)
@@ -245,16 +262,7 @@ def get_next_chunk(
     if not chunk:
         return None
     
-    video = session.get(Video, chunk.video_id)
-    total = session.exec(
-        select(Chunk).where(Chunk.video_id == chunk.video_id)
-    ).all()
-    
-    return ChunkDetailResponse(
-        **chunk.model_dump(),
-        video_title=video.title if video else "Unknown",
-        total_chunks=len(total)
-    )
+    return build_chunk_detail(chunk, session)
 
 
 @router.get("/chunks/{chunk_id}", response_model=ChunkDetailResponse)
@@ -264,16 +272,7 @@ def get_chunk(chunk_id: int, session: Session = Depends(get_session)):
     if not chunk:
         raise HTTPException(status_code=404, detail="Chunk not found")
     
-    video = session.get(Video, chunk.video_id)
-    total = session.exec(
-        select(Chunk).where(Chunk.video_id == chunk.video_id)
-    ).all()
-    
-    return ChunkDetailResponse(
-        **chunk.model_dump(),
-        video_title=video.title if video else "Unknown",
-        total_chunks=len(total)
-    )
+    return build_chunk_detail(chunk, session)
 
 
 @router.post("/chunks/{chunk_id}/lock", response_model=LockResponse)
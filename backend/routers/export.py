@@ -80,7 +80,7 @@ def get_export_preview(
     
     # Duration query - sum of segment durations
     duration_query = (
-        select(func.sum(Segment.end_time_relative - Segment.start_time_relative))
+        select(func.sum(Segment.duration))
         .join(Chunk, Segment.chunk_id == Chunk.id)
         .where(
             Chunk.status == ProcessingStatus.APPROVED,
@@ -114,7 +114,7 @@ def get_export_preview(
         )
         
         duration_query = (
-            select(func.sum(Segment.end_time_relative - Segment.start_time_relative))
+            select(func.sum(Segment.duration))
             .join(Chunk, Segment.chunk_id == Chunk.id)
             .join(Video, Chunk.video_id == Video.id)
             .where(
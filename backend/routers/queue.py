@@ -19,16 +19,17 @@ Endpoints:
 import asyncio
 import json
 import logging
+from collections import deque
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from fastapi import APIRouter, Depends, Query, HTTPException
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from sqlalchemy import text
-from sqlmodel import Session, select
+from sqlalchemy import func, text
+from sqlmodel import Session, select, or_
 
-from backend.db.engine import get_session, engine
+from backend.db.engine import get_session, engine, notify_jobs_queued
 from backend.db.models import (
     User, Video, Chunk, Channel,
     ProcessingJob, JobStatus, ProcessingStatus
@@ -39,6 +40,13 @@ from backend.auth.deps import get_current_user
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/queue", tags=["Processing Queue"])
 
+# Heartbeat payload never changes, so serialize it once
+HEARTBEAT_EVENT = f"data: {json.dumps({'event': 'heartbeat'})}\n\n"
+
+# Last /logs response, keyed by (mtime_ns, size, lines) of the log file.
+# The Preprocessing page polls it; the file usually hasn't changed in between.
+_logs_cache: Optional[Tuple[Tuple[int, int, int], dict]] = None
+
 
 # =============================================================================
 # SCHEMAS
@@ -118,45 +126,48 @@ def add_videos_to_queue(
     Returns:
         Count of queued and skipped chunks
     """
-    queued_count = 0
-    skipped_count = 0
-    
-    for video_id in request.video_ids:
-        # Verify video exists
-        video = session.get(Video, video_id)
-        if not video:
+    video_ids = list(dict.fromkeys(request.video_ids))
+    
+    # Three set-based queries for the whole request instead of one per
+    # video plus one per chunk
+    existing_videos = set(session.exec(
+        select(Video.id).where(Video.id.in_(video_ids))
+    ).all())
+    for video_id in video_ids:
+        if video_id not in existing_videos:
             logger.warning(f"Video {video_id} not found, skipping")
-            continue
-        
-        # Get all PENDING chunks for this video
-        chunks = session.exec(
-            select(Chunk)
-            .where(Chunk.video_id == video_id)
-            .where(Chunk.status == ProcessingStatus.PENDING)
-        ).all()
-        
-        for chunk in chunks:
-            # Check if already in active queue (QUEUED or PROCESSING)
-            existing = session.exec(
-                select(ProcessingJob)
-                .where(ProcessingJob.chunk_id == chunk.id)
-                .where(ProcessingJob.status.in_([JobStatus.QUEUED, JobStatus.PROCESSING]))
-            ).first()
-            
-            if existing:
-                skipped_count += 1
-                continue
-            
-            # Add to queue
-            job = ProcessingJob(
-                chunk_id=chunk.id,
-                video_id=video_id,
-                status=JobStatus.QUEUED,
-                requested_by_user_id=current_user.id
-            )
-            session.add(job)
-            queued_count += 1
     
+    # All PENDING chunks for these videos
+    chunks = session.exec(
+        select(Chunk.id, Chunk.video_id)
+        .where(Chunk.video_id.in_(existing_videos))
+        .where(Chunk.status == ProcessingStatus.PENDING)
+        .order_by(Chunk.video_id, Chunk.chunk_index)
+    ).all()
+    
+    # Chunks already in the active queue (QUEUED or PROCESSING)
+    active_chunk_ids = set(session.exec(
+        select(ProcessingJob.chunk_id)
+        .where(ProcessingJob.chunk_id.in_([chunk_id for chunk_id, _ in chunks]))
+        .where(ProcessingJob.status.in_([JobStatus.QUEUED, JobStatus.PROCESSING]))
+    ).all())
+    
+    jobs = [
+        ProcessingJob(
+            chunk_id=chunk_id,
+            video_id=video_id,
+            status=JobStatus.QUEUED,
+            requested_by_user_id=current_user.id
+        )
+        for chunk_id, video_id in chunks
+        if chunk_id not in active_chunk_ids
+    ]
+    session.add_all(jobs)
+    queued_count = len(jobs)
+    skipped_count = len(chunks) - queued_count
+    
+    if jobs:
+        notify_jobs_queued(session)
     session.commit()
     
     logger.info(
@@ -259,50 +270,71 @@ async def stream_queue_status():
             
             try:
                 with Session(engine) as sess:
+                    # Cheap gate: when no job started or finished since the
+                    # last poll (the usual idle case), skip the three
+                    # per-event queries entirely
+                    changed = sess.exec(
+                        select(
+                            select(ProcessingJob.id)
+                            .where(or_(
+                                ProcessingJob.started_at > last_check,
+                                ProcessingJob.completed_at > last_check,
+                            ))
+                            .exists()
+                        )
+                    ).one()
+                    if not changed:
+                        yield HEARTBEAT_EVENT
+                        continue
+                    
                     # Check for jobs that changed since last check
                     # Processing started
                     started = sess.exec(
-                        select(ProcessingJob)
+                        select(ProcessingJob.chunk_id, ProcessingJob.video_id)
                         .where(ProcessingJob.status == JobStatus.PROCESSING)
                         .where(ProcessingJob.started_at > last_check)
                     ).all()
                     
-                    for job in started:
+                    for chunk_id, video_id in started:
                         event = {
                             "event": "job_started",
-                            "chunk_id": job.chunk_id,
-                            "video_id": job.video_id
+                            "chunk_id": chunk_id,
+                            "video_id": video_id
                         }
                         yield f"data: {json.dumps(event)}\n\n"
                     
                     # Completed jobs
                     completed = sess.exec(
-                        select(ProcessingJob)
+                        select(ProcessingJob.chunk_id, ProcessingJob.video_id)
                         .where(ProcessingJob.status == JobStatus.COMPLETED)
                         .where(ProcessingJob.completed_at > last_check)
                     ).all()
                     
-                    for job in completed:
+                    for chunk_id, video_id in completed:
                         event = {
                             "event": "job_completed",
-                            "chunk_id": job.chunk_id,
-                            "video_id": job.video_id
+                            "chunk_id": chunk_id,
+                            "video_id": video_id
                         }
                         yield f"data: {json.dumps(event)}\n\n"
                     
                     # Failed jobs
                     failed = sess.exec(
-                        select(ProcessingJob)
+                        select(
+                            ProcessingJob.chunk_id,
+                            ProcessingJob.video_id,
+                            ProcessingJob.error_message,
+                        )
                         .where(ProcessingJob.status == JobStatus.FAILED)
                         .where(ProcessingJob.completed_at > last_check)
                     ).all()
                     
-                    for job in failed:
+                    for chunk_id, video_id, error_message in failed:
                         event = {
                             "event": "job_failed",
-                            "chunk_id": job.chunk_id,
-                            "video_id": job.video_id,
-                            "error": job.error_message or "Unknown error"
+                            "chunk_id": chunk_id,
+                            "video_id": video_id,
+                            "error": error_message or "Unknown error"
                         }
                         yield f"data: {json.dumps(event)}\n\n"
                     
@@ -312,7 +344,7 @@ async def stream_queue_status():
                 logger.error(f"SSE error: {e}")
             
             # Send heartbeat to keep connection alive
-            yield f"data: {json.dumps({'event': 'heartbeat'})}\n\n"
+            yield HEARTBEAT_EVENT
     
     return StreamingResponse(
         event_generator(),
@@ -353,35 +385,37 @@ def retry_failed_jobs(
     if not video:
         raise HTTPException(status_code=404, detail="Video not found")
     
-    # Find chunks with FAILED jobs (and no new QUEUED/PROCESSING job)
-    failed_chunks = session.exec(
-        select(ProcessingJob)
+    # Chunks with FAILED jobs (a chunk may have failed more than once)
+    failed_chunk_ids = session.exec(
+        select(ProcessingJob.chunk_id)
         .where(ProcessingJob.video_id == video_id)
         .where(ProcessingJob.status == JobStatus.FAILED)
+        .distinct()
+        .order_by(ProcessingJob.chunk_id)
     ).all()
     
-    retried = 0
-    for old_job in failed_chunks:
-        # Check if chunk already has a new active job
-        existing = session.exec(
-            select(ProcessingJob)
-            .where(ProcessingJob.chunk_id == old_job.chunk_id)
-            .where(ProcessingJob.status.in_([JobStatus.QUEUED, JobStatus.PROCESSING]))
-        ).first()
-        
-        if existing:
-            continue  # Already being retried
-        
-        # Create new job
-        new_job = ProcessingJob(
-            chunk_id=old_job.chunk_id,
+    # Skip chunks that already have a new active job (already being retried)
+    active_chunk_ids = set(session.exec(
+        select(ProcessingJob.chunk_id)
+        .where(ProcessingJob.chunk_id.in_(failed_chunk_ids))
+        .where(ProcessingJob.status.in_([JobStatus.QUEUED, JobStatus.PROCESSING]))
+    ).all())
+    
+    jobs = [
+        ProcessingJob(
+            chunk_id=chunk_id,
             video_id=video_id,
             status=JobStatus.QUEUED,
             requested_by_user_id=current_user.id
         )
-        session.add(new_job)
-        retried += 1
+        for chunk_id in failed_chunk_ids
+        if chunk_id not in active_chunk_ids
+    ]
+    session.add_all(jobs)
+    retried = len(jobs)
     
+    if jobs:
+        notify_jobs_queued(session)
     session.commit()
     
     logger.info(f"User {current_user.username} retried {retried} failed chunks for video {video_id}")
@@ -490,21 +524,21 @@ def get_queue_stats(session: Session = Depends(get_session)):
     
     Returns counts of jobs in each status for dashboard display.
     """
-    stats = {}
+    # One grouped count instead of loading every job row per status
+    stats = {status.value: 0 for status in JobStatus}
     
-    for status in JobStatus:
-        count = session.exec(
-            select(ProcessingJob)
-            .where(ProcessingJob.status == status)
-        ).all()
-        stats[status.value] = len(count)
+    job_counts = session.exec(
+        select(ProcessingJob.status, func.count(ProcessingJob.id))
+        .group_by(ProcessingJob.status)
+    ).all()
+    for status, count in job_counts:
+        stats[status.value] = count
     
     # Also count pending chunks (not in queue)
-    pending_chunks = session.exec(
-        select(Chunk)
+    stats["pending_chunks"] = session.exec(
+        select(func.count(Chunk.id))
         .where(Chunk.status == ProcessingStatus.PENDING)
-    ).all()
-    stats["pending_chunks"] = len(pending_chunks)
+    ).one()
     
     return stats
 
@@ -518,13 +552,17 @@ def get_worker_logs(
     Get the last N lines from the Gemini worker log file.
     
     Used by the Preprocessing page to monitor worker activity.
+    Re-reads the file only when its mtime/size changed since the last call.
     """
+    global _logs_cache
     from pathlib import Path
     
     # Log file location relative to backend directory
     log_file = Path(__file__).parent.parent.parent / "logs" / "gemini_worker.log"
     
-    if not log_file.exists():
+    try:
+        st = log_file.stat()
+    except FileNotFoundError:
         return {
             "log_file": str(log_file),
             "exists": False,
@@ -532,18 +570,27 @@ def get_worker_logs(
             "message": "Log file not found. The worker may not have started yet."
         }
     
+    cache_key = (st.st_mtime_ns, st.st_size, lines)
+    if _logs_cache and _logs_cache[0] == cache_key:
+        return _logs_cache[1]
+    
     try:
-        # Read last N lines efficiently
+        # Stream the file, keeping only the last N lines in memory
+        last_lines = deque(maxlen=lines)
+        total_lines = 0
         with open(log_file, 'r', encoding='utf-8') as f:
-            all_lines = f.readlines()
-            last_lines = all_lines[-lines:] if len(all_lines) > lines else all_lines
+            for line in f:
+                last_lines.append(line)
+                total_lines += 1
         
-        return {
+        result = {
             "log_file": str(log_file),
             "exists": True,
-            "total_lines": len(all_lines),
+            "total_lines": total_lines,
             "lines": [line.rstrip('\n\r') for line in last_lines]
         }
+        _logs_cache = (cache_key, result)
+        return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to read log file: {str(e)}")
 
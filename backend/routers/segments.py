@@ -165,10 +165,11 @@ def update_segment(
     segment.updated_at = datetime.utcnow()
     
     session.add(segment)
+    # Serialize before commit so the response doesn't cost a re-SELECT
+    response = SegmentResponse.model_validate(segment)
     session.commit()
-    session.refresh(segment)
     
-    return segment
+    return response
 
 
 @router.post("/segments", response_model=SegmentResponse)
@@ -201,10 +202,13 @@ def create_segment(
     
     segment = Segment(**data.model_dump())
     session.add(segment)
+    # INSERT ... RETURNING fills in the id; serialize before commit so the
+    # response doesn't cost a re-SELECT
+    session.flush()
+    response = SegmentResponse.model_validate(segment)
     session.commit()
-    session.refresh(segment)
     
-    return segment
+    return response
 
 
 @router.delete("/segments/{segment_id}")
@@ -251,10 +255,11 @@ def verify_segment(
     segment.updated_at = datetime.utcnow()
     
     session.add(segment)
+    # Serialize before commit so the response doesn't cost a re-SELECT
+    response = SegmentResponse.model_validate(segment)
     session.commit()
-    session.refresh(segment)
     
-    return segment
+    return response
 
 
 class BulkActionRequest(BaseModel):
@@ -262,6 +267,80 @@ class BulkActionRequest(BaseModel):
     segment_ids: List[int]
 
 
+class SegmentBulkUpdateItem(SegmentUpdate):
+    """One segment's changes within a bulk update."""
+    id: int
+
+
+class BulkUpdateRequest(BaseModel):
+    """Request body for saving several edited segments at once."""
+    updates: List[SegmentBulkUpdateItem]
+
+
+@router.post("/segments/bulk-update")
+def bulk_update_segments(
+    data: BulkUpdateRequest,
+    current_user: User = Depends(get_current_user),
+    session: Session = Depends(get_session)
+):
+    """
+    Apply edits to multiple segments in a single transaction.
+    
+    Used by the Workbench "Save" action instead of one PUT per edited row.
+    User must have lock on every affected chunk; all updates are validated
+    before any are applied, so the batch succeeds or fails as a whole.
+    """
+    if not data.updates:
+        return {"message": "Updated 0 segments", "count": 0}
+    
+    ids = [item.id for item in data.updates]
+    # Each item is validated against the stored times, so two items for the
+    # same segment could each pass and still combine into an invalid range
+    if len(set(ids)) != len(ids):
+        raise HTTPException(status_code=400, detail="Duplicate segment ids in updates")
+    
+    segments = {
+        s.id: s for s in session.exec(select(Segment).where(Segment.id.in_(ids))).all()
+    }
+    missing = [segment_id for segment_id in ids if segment_id not in segments]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Segments not found: {missing}")
+    
+    # Check chunk locks
+    chunk_ids = {s.chunk_id for s in segments.values()}
+    chunks = session.exec(select(Chunk).where(Chunk.id.in_(chunk_ids))).all()
+    if len(chunks) != len(chunk_ids):
+        raise HTTPException(status_code=404, detail="Parent chunk not found")
+    if any(chunk.locked_by_user_id != current_user.id for chunk in chunks):
+        raise HTTPException(
+            status_code=403,
+            detail="You must lock the chunk before editing segments"
+        )
+    
+    # Validate all timestamps before touching anything
+    changes = []
+    for item in data.updates:
+        segment = segments[item.id]
+        update_data = item.model_dump(exclude_unset=True, exclude={"id"})
+        new_start = update_data.get("start_time_relative", segment.start_time_relative)
+        new_end = update_data.get("end_time_relative", segment.end_time_relative)
+        try:
+            validate_segment_times(new_start, new_end)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Segment {item.id}: {e}")
+        changes.append((segment, update_data))
+    
+    now = datetime.utcnow()
+    for segment, update_data in changes:
+        for key, value in update_data.items():
+            setattr(segment, key, value)
+        segment.updated_at = now
+        session.add(segment)
+    
+    session.commit()
+    return {"message": f"Updated {len(changes)} segments", "count": len(changes)}
+
+
 @router.post("/segments/bulk-verify")
 def bulk_verify_segments(
     data: BulkActionRequest,
@@ -3,8 +3,9 @@ Users Router - List and manage annotators.
 Channels Router - CRUD for YouTube source channels.
 """
 
+import time
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlmodel import Session, select
@@ -16,6 +17,11 @@ from backend.db.models import User, UserRole, Channel
 
 router = APIRouter()
 
+# Dashboard stats are aggregate counts over every table; serve them from a
+# short-lived in-process cache instead of re-aggregating on every request
+STATS_CACHE_TTL_SECONDS = 30
+_stats_cache: Optional[Tuple[float, "SystemStatsResponse"]] = None
+
 
 # =============================================================================
 # SCHEMAS
@@ -156,48 +162,34 @@ def get_channels_stats(session: Session = Depends(get_session)):
     from sqlalchemy import func
     from backend.db.models import Video, Chunk, ProcessingStatus
     
-    channels = session.exec(select(Channel)).all()
+    # Single grouped query over channels -> videos -> chunks (was 4 per channel)
+    rows = session.exec(
+        select(
+            Channel.id,
+            func.count(func.distinct(Video.id)),
+            func.count(Chunk.id),
+            func.count(Chunk.id).filter(
+                Chunk.status.in_([ProcessingStatus.PENDING, ProcessingStatus.REVIEW_READY, ProcessingStatus.IN_REVIEW])
+            ),
+            func.count(Chunk.id).filter(Chunk.status == ProcessingStatus.APPROVED),
+        )
+        .select_from(Channel)
+        .outerjoin(Video, Video.channel_id == Channel.id)
+        .outerjoin(Chunk, Chunk.video_id == Video.id)
+        .group_by(Channel.id)
+        .order_by(Channel.id)
+    ).all()
     
-    results = []
-    for channel in channels:
-        video_count = session.exec(
-            select(func.count(Video.id)).where(Video.channel_id == channel.id)
-        ).one()
-        
-        video_ids = session.exec(
-            select(Video.id).where(Video.channel_id == channel.id)
-        ).all()
-        
-        if video_ids:
-            total_chunks = session.exec(
-                select(func.count(Chunk.id)).where(Chunk.video_id.in_(video_ids))
-            ).one()
-            
-            pending_chunks = session.exec(
-                select(func.count(Chunk.id)).where(
-                    Chunk.video_id.in_(video_ids),
-                    Chunk.status.in_([ProcessingStatus.PENDING, ProcessingStatus.REVIEW_READY, ProcessingStatus.IN_REVIEW])
-                )
-            ).one()
-            
-            approved_chunks = session.exec(
-                select(func.count(Chunk.id)).where(
-                    Chunk.video_id.in_(video_ids),
-                    Chunk.status == ProcessingStatus.APPROVED
-                )
-            ).one()
-        else:
-            total_chunks = pending_chunks = approved_chunks = 0
-        
-        results.append(ChannelStatsResponse(
-            channel_id=channel.id,
+    return [
+        ChannelStatsResponse(
+            channel_id=channel_id,
             total_videos=video_count,
             total_chunks=total_chunks,
             pending_chunks=pending_chunks,
             approved_chunks=approved_chunks
-        ))
-    
-    return results
+        )
+        for channel_id, video_count, total_chunks, pending_chunks, approved_chunks in rows
+    ]
 
 
 @router.get("/stats", response_model=SystemStatsResponse)
@@ -206,53 +198,61 @@ def get_system_stats(session: Session = Depends(get_session)):
     Get system-wide statistics.
     
     Used by Dashboard header to show total channels, videos, hours, etc.
+    Cached for STATS_CACHE_TTL_SECONDS.
     """
+    global _stats_cache
+    if _stats_cache and time.monotonic() - _stats_cache[0] < STATS_CACHE_TTL_SECONDS:
+        return _stats_cache[1]
+    
     from datetime import datetime
     from sqlalchemy import func
     from backend.db.models import Video, Chunk, Segment, ProcessingStatus
     
-    total_channels = session.exec(select(func.count(Channel.id))).one()
-    total_videos = session.exec(select(func.count(Video.id))).one()
-    total_chunks = session.exec(select(func.count(Chunk.id))).one()
-    total_segments = session.exec(select(func.count(Segment.id))).one()
-    
-    approved_segments = session.exec(
-        select(func.count(Segment.id)).where(Segment.is_verified == True)
+    # One round trip: every figure is a scalar subquery in a single SELECT row
+    now = datetime.utcnow()
+    (
+        total_channels,
+        total_videos,
+        total_chunks,
+        total_segments,
+        approved_segments,
+        total_seconds,
+        verified_duration,
+        chunks_pending_review,
+        active_locks,
+    ) = session.exec(
+        select(
+            select(func.count(Channel.id)).scalar_subquery(),
+            select(func.count(Video.id)).scalar_subquery(),
+            select(func.count(Chunk.id)).scalar_subquery(),
+            select(func.count(Segment.id)).scalar_subquery(),
+            select(func.count(Segment.id)).where(Segment.is_verified == True).scalar_subquery(),
+            select(func.coalesce(func.sum(Video.duration_seconds), 0)).scalar_subquery(),
+            # Project Progress: Verified Hours
+            select(func.coalesce(
+                func.sum(Segment.duration),
+                0
+            )).where(Segment.is_verified == True).scalar_subquery(),
+            # Workflow Status: Chunks Pending Review
+            select(func.count(Chunk.id)).where(
+                Chunk.status == ProcessingStatus.REVIEW_READY
+            ).scalar_subquery(),
+            # Workflow Status: Active Locks (not expired)
+            select(func.count(Chunk.id)).where(
+                Chunk.locked_by_user_id.isnot(None),
+                Chunk.lock_expires_at > now
+            ).scalar_subquery(),
+        )
     ).one()
     
-    total_seconds = session.exec(
-        select(func.coalesce(func.sum(Video.duration_seconds), 0))
-    ).one()
     total_hours = total_seconds / 3600.0 if total_seconds else 0.0
-    
-    # Project Progress: Verified Hours
-    verified_duration = session.exec(
-        select(func.coalesce(
-            func.sum(Segment.end_time_relative - Segment.start_time_relative),
-            0
-        )).where(Segment.is_verified == True)
-    ).one()
     verified_hours = verified_duration / 3600.0 if verified_duration else 0.0
     
     # Completion percentage (target: 50 hours)
     target_hours = 50.0
     completion_percentage = min((verified_hours / target_hours) * 100, 100.0) if target_hours > 0 else 0.0
     
-    # Workflow Status: Chunks Pending Review
-    chunks_pending_review = session.exec(
-        select(func.count(Chunk.id)).where(Chunk.status == ProcessingStatus.REVIEW_READY)
-    ).one()
-    
-    # Workflow Status: Active Locks (not expired)
-    now = datetime.utcnow()
-    active_locks = session.exec(
-        select(func.count(Chunk.id)).where(
-            Chunk.locked_by_user_id.isnot(None),
-            Chunk.lock_expires_at > now
-        )
-    ).one()
-    
-    return SystemStatsResponse(
+    stats = SystemStatsResponse(
         total_channels=total_channels,
         total_videos=total_videos,
         total_chunks=total_chunks,
@@ -265,6 +265,9 @@ def get_system_stats(session: Session = Depends(get_session)):
         chunks_pending_review=chunks_pending_review,
         active_locks=active_locks
     )
+    _stats_cache = (time.monotonic(), stats)
+    
+    return stats
 
 
 # =============================================================================
@@ -5,20 +5,22 @@ Upload flow:
 1. Validate URL not duplicate
 2. Save audio file to data/raw/
 3. Create Video record
-4. Auto-chunk into 5-minute segments (non-blocking)
+4. Auto-chunk into 5-minute segments (background task)
 """
 
+import os
 import shutil
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, UploadFile, File, Form, Query
+from fastapi.concurrency import run_in_threadpool
 from sqlmodel import Session, select
 from pydantic import BaseModel
 
-from backend.db.engine import get_session, DATA_ROOT
+from backend.db.engine import get_session, DATA_ROOT, engine, notify_jobs_queued
 from backend.db.models import Video, Channel, User
 from backend.auth.deps import get_current_user
 
@@ -55,16 +57,62 @@ class VideoCheckResponse(BaseModel):
     message: str
 
 
+class VideoCheckBatchRequest(BaseModel):
+    """Request to check many URLs for duplicates at once."""
+    urls: List[str]
+
+
+class VideoCheckBatchResponse(BaseModel):
+    """Response for batch duplicate check."""
+    existing: Dict[str, int]  # URL -> ID of the video that already has it
+
+
 class VideoUploadResponse(BaseModel):
     """Response after video upload."""
     video_id: int
     title: str
     file_path: str
-    chunks_created: int = 0  # Number of chunks created (0 if failed)
-    jobs_queued: int = 0  # Number of chunks auto-queued for Gemini processing
     message: str
 
 
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+COPY_BUFFER_SIZE = 1024 * 1024  # 1 MiB
+
+
+def save_upload(src, dest_path: Path) -> None:
+    """
+    Write an uploaded file to disk.
+    
+    Starlette spools uploads to a temp file once they exceed its memory
+    threshold. In that case copy with os.sendfile (kernel-side, no userspace
+    buffers) where available; otherwise stream in 1 MiB blocks.
+    
+    Args:
+        src: UploadFile.file (SpooledTemporaryFile)
+        dest_path: Destination path
+    """
+    src.seek(0)
+    
+    # Check _rolled first: calling fileno() on an in-memory spool forces a rollover
+    disk_file = getattr(src, "_file", None) if getattr(src, "_rolled", False) else None
+    
+    with open(dest_path, "wb") as f:
+        if disk_file is not None and hasattr(os, "sendfile"):
+            in_fd = disk_file.fileno()
+            size = os.fstat(in_fd).st_size
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(f.fileno(), in_fd, offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        else:
+            shutil.copyfileobj(src, f, length=COPY_BUFFER_SIZE)
+
+
 # =============================================================================
 # ENDPOINTS
 # =============================================================================
@@ -122,6 +170,32 @@ def check_video_exists(
     )
 
 
+@router.post("/videos/check-batch", response_model=VideoCheckBatchResponse)
+def check_videos_exist(
+    request: VideoCheckBatchRequest,
+    session: Session = Depends(get_session)
+):
+    """
+    Check many video URLs against the database in a single query.
+    
+    Used by ingestion GUI to check a whole playlist without one request
+    per video.
+    
+    Returns:
+        existing: Mapping of each already-ingested URL to its video ID.
+        URLs not in the mapping are OK to download.
+    """
+    urls = list(dict.fromkeys(url.strip() for url in request.urls))
+    if not urls:
+        return VideoCheckBatchResponse(existing={})
+    
+    rows = session.exec(
+        select(Video.original_url, Video.id).where(Video.original_url.in_(urls))
+    ).all()
+    
+    return VideoCheckBatchResponse(existing={url: video_id for url, video_id in rows})
+
+
 @router.get("/videos/{video_id}", response_model=VideoResponse)
 def get_video(video_id: int, session: Session = Depends(get_session)):
     """Get a specific video by ID."""
@@ -133,6 +207,7 @@ def get_video(video_id: int, session: Session = Depends(get_session)):
 
 @router.post("/videos/upload", response_model=VideoUploadResponse)
 async def upload_video(
+    background_tasks: BackgroundTasks,
     audio: UploadFile = File(...),
     title: str = Form(...),
     duration_seconds: int = Form(...),
@@ -144,7 +219,8 @@ async def upload_video(
     """
     Upload a video/audio file.
     
-    Stores file in data/raw/ and creates Video record.
+    Stores file in data/raw/ and creates Video record. Chunking and
+    queueing run in the background after the response is returned.
     
     Args:
         audio: The audio file (.m4a, .wav, etc.)
@@ -186,8 +262,8 @@ async def upload_video(
     raw_dir.mkdir(parents=True, exist_ok=True)
     file_path = raw_dir / filename
     
-    with open(file_path, "wb") as f:
-        shutil.copyfileobj(audio.file, f)
+    # Off the event loop: copying a large upload would stall other requests
+    await run_in_threadpool(save_upload, audio.file, file_path)
     
     # Create database record
     video = Video(
@@ -202,50 +278,65 @@ async def upload_video(
     session.commit()
     session.refresh(video)
     
-    # Auto-chunk the video (non-blocking - errors don't fail upload)
-    chunks_created = 0
-    jobs_queued = 0
-    try:
-        from backend.processing.chunker import chunk_video
-        chunks_created = chunk_video(video.id, session)
-        logger.info(f"Auto-chunked video {video.id}: {chunks_created} chunks created")
-        
-        # Auto-queue for Gemini processing
-        if chunks_created > 0:
-            from backend.db.models import Chunk, ProcessingJob, JobStatus, ProcessingStatus
-            chunks = session.exec(
-                select(Chunk)
-                .where(Chunk.video_id == video.id)
-                .where(Chunk.status == ProcessingStatus.PENDING)
-            ).all()
-            
-            for chunk in chunks:
-                job = ProcessingJob(
-                    chunk_id=chunk.id,
-                    video_id=video.id,
-                    status=JobStatus.QUEUED,
-                    requested_by_user_id=current_user.id
-                )
-                session.add(job)
-                jobs_queued += 1
-            
-            session.commit()
-            logger.info(f"Auto-queued {jobs_queued} chunks for Gemini processing (video {video.id})")
-            
-    except Exception as e:
-        logger.error(f"Auto-chunk/queue failed for video {video.id}: {e}")
-        # Don't fail the upload, just log the error
+    # Auto-chunk + queue after the response is sent (errors don't fail upload)
+    background_tasks.add_task(chunk_and_queue_video, video.id, current_user.id)
     
     return VideoUploadResponse(
         video_id=video.id,
         title=video.title,
         file_path=video.file_path,
-        chunks_created=chunks_created,
-        jobs_queued=jobs_queued,
-        message=f"Video uploaded successfully. {chunks_created} chunks created, {jobs_queued} queued for processing."
+        message="Video uploaded successfully. Chunking and queueing started in background."
     )
 
 
+def chunk_and_queue_video(video_id: int, user_id: int) -> None:
+    """
+    Chunk an uploaded video and queue its chunks for Gemini processing.
+    
+    Runs as a background task after the upload response is sent, so the
+    client doesn't wait on FFmpeg. Uses its own session since the request
+    session is closed by then.
+    
+    Args:
+        video_id: ID of the uploaded video
+        user_id: Uploading user (recorded as job requester)
+    """
+    from backend.processing.chunker import chunk_video
+    from backend.db.models import Chunk, ProcessingJob, JobStatus, ProcessingStatus
+    
+    with Session(engine) as session:
+        try:
+            chunks_created = chunk_video(video_id, session)
+            logger.info(f"Auto-chunked video {video_id}: {chunks_created} chunks created")
+            
+            # Auto-queue for Gemini processing
+            if chunks_created > 0:
+                chunks = session.exec(
+                    select(Chunk)
+                    .where(Chunk.video_id == video_id)
+                    .where(Chunk.status == ProcessingStatus.PENDING)
+                ).all()
+                
+                jobs_queued = 0
+                for chunk in chunks:
+                    job = ProcessingJob(
+                        chunk_id=chunk.id,
+                        video_id=video_id,
+                        status=JobStatus.QUEUED,
+                        requested_by_user_id=user_id
+                    )
+                    session.add(job)
+                    jobs_queued += 1
+                
+                if jobs_queued:
+                    notify_jobs_queued(session)
+                session.commit()
+                logger.info(f"Auto-queued {jobs_queued} chunks for Gemini processing (video {video_id})")
+                
+        except Exception as e:
+            logger.error(f"Auto-chunk/queue failed for video {video_id}: {e}")
+
+
 @router.post("/videos/{video_id}/chunk")
 def trigger_manual_chunking(
     video_id: int,
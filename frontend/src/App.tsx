@@ -10,7 +10,7 @@
  * 6. Settings - User/system config
  */
 
-import { useState, useEffect } from 'react'
+import { useState, useEffect, lazy, Suspense } from 'react'
 import {
     Box,
     Tabs,
@@ -37,12 +37,14 @@ import { useQuery } from '@tanstack/react-query'
 import { api, setApiUserId } from './api/client'
 
 // Page imports
+// Dashboard is the landing tab; the others are split into their own bundles
+// and fetched on first visit (the Workbench pulls in wavesurfer.js)
 import { DashboardPage } from './pages/DashboardPage'
-import { ChannelPage } from './pages/ChannelPage'
-import { PreprocessingPage } from './pages/PreprocessingPage'
-import { WorkbenchPage } from './pages/WorkbenchPage'
-import { ExportPage } from './pages/ExportPage'
-import { SettingsPage } from './pages/SettingsPage'
+const ChannelPage = lazy(() => import('./pages/ChannelPage').then(m => ({ default: m.ChannelPage })))
+const PreprocessingPage = lazy(() => import('./pages/PreprocessingPage').then(m => ({ default: m.PreprocessingPage })))
+const WorkbenchPage = lazy(() => import('./pages/WorkbenchPage').then(m => ({ default: m.WorkbenchPage })))
+const ExportPage = lazy(() => import('./pages/ExportPage').then(m => ({ default: m.ExportPage })))
+const SettingsPage = lazy(() => import('./pages/SettingsPage').then(m => ({ default: m.SettingsPage })))
 
 // Types
 interface User {
@@ -240,47 +242,55 @@ function App() {
 
             {/* Tab content area */}
             <Box className="app-content">
-                {currentTab === 'dashboard' && (
-                    <DashboardPage userId={selectedUserId} />
-                )}
+                <Suspense
+                    fallback={
+                        <Box sx={{ display: 'flex', justifyContent: 'center', p: 4 }}>
+                            <CircularProgress />
+                        </Box>
+                    }
+                >
+                    {currentTab === 'dashboard' && (
+                        <DashboardPage userId={selectedUserId} />
+                    )}
 
-                {currentTab === 'channel' && (
-                    <ChannelPage
-                        userId={selectedUserId}
-                        onVideoSelect={handleVideoSelect}
-                        persistedSelectedChannelId={channelTabSelectedChannelId}
-                        onPersistChannelSelect={setChannelTabSelectedChannelId}
-                        persistedExpandedVideoId={channelTabExpandedVideoId}
-                        onPersistVideoExpand={setChannelTabExpandedVideoId}
-                    />
-                )}
+                    {currentTab === 'channel' && (
+                        <ChannelPage
+                            userId={selectedUserId}
+                            onVideoSelect={handleVideoSelect}
+                            persistedSelectedChannelId={channelTabSelectedChannelId}
+                            onPersistChannelSelect={setChannelTabSelectedChannelId}
+                            persistedExpandedVideoId={channelTabExpandedVideoId}
+                            onPersistVideoExpand={setChannelTabExpandedVideoId}
+                        />
+                    )}
 
-                {currentTab === 'preprocessing' && (
-                    <PreprocessingPage userId={selectedUserId} />
-                )}
+                    {currentTab === 'preprocessing' && (
+                        <PreprocessingPage userId={selectedUserId} />
+                    )}
 
-                {currentTab === 'annotation' && (
-                    <WorkbenchPage
-                        userId={selectedUserId}
-                        username={selectedUser?.username || 'User'}
-                        preselectedVideoId={selectedVideoId}
-                        preselectedChunkId={selectedChunkId}
-                        onBackToDashboard={() => {
-                            // Clear selected IDs so we don't auto-reload the same chunk
-                            setSelectedVideoId(null)
-                            setSelectedChunkId(null)
-                            setCurrentTab('channel')
-                        }}
-                    />
-                )}
+                    {currentTab === 'annotation' && (
+                        <WorkbenchPage
+                            userId={selectedUserId}
+                            username={selectedUser?.username || 'User'}
+                            preselectedVideoId={selectedVideoId}
+                            preselectedChunkId={selectedChunkId}
+                            onBackToDashboard={() => {
+                                // Clear selected IDs so we don't auto-reload the same chunk
+                                setSelectedVideoId(null)
+                                setSelectedChunkId(null)
+                                setCurrentTab('channel')
+                            }}
+                        />
+                    )}
 
-                {currentTab === 'export' && (
-                    <ExportPage userId={selectedUserId} />
-                )}
+                    {currentTab === 'export' && (
+                        <ExportPage userId={selectedUserId} />
+                    )}
 
-                {currentTab === 'settings' && (
-                    <SettingsPage userId={selectedUserId} />
-                )}
+                    {currentTab === 'settings' && (
+                        <SettingsPage userId={selectedUserId} />
+                    )}
+                </Suspense>
             </Box>
         </Box>
     )
@@ -9,12 +9,14 @@
  * - Added selection mode
  */
 
-import { useState, useCallback, useEffect, useRef } from 'react'
+import { memo, useState, useCallback, useEffect, useMemo, useRef } from 'react'
 import {
     Box,
     IconButton,
     Checkbox,
     TextField,
+    SxProps,
+    Theme,
     Tooltip,
     Typography,
     Button,
@@ -71,7 +73,233 @@ function parseTime(timeStr: string): number | null {
     return null
 }
 
-export function SegmentTable({
+interface DraftFieldProps {
+    value: string
+    onCommit: (value: string) => boolean | void  // return false to reject and revert
+    onDirty?: () => void
+    fullWidth?: boolean
+    multiline?: boolean
+    placeholder?: string
+    sx?: SxProps<Theme>
+}
+
+// Text cell that keeps keystrokes in local state and commits on blur,
+// so typing doesn't re-render the whole table on every key press
+function DraftField({ value, onCommit, onDirty, fullWidth, multiline, placeholder, sx }: DraftFieldProps) {
+    const [draft, setDraft] = useState(value)
+
+    // Follow the committed value (e.g. after save/refetch)
+    useEffect(() => {
+        setDraft(value)
+    }, [value])
+
+    return (
+        <TextField
+            size="small"
+            variant="standard"
+            fullWidth={fullWidth}
+            multiline={multiline}
+            placeholder={placeholder}
+            sx={sx}
+            value={draft}
+            onChange={(e) => {
+                setDraft(e.target.value)
+                onDirty?.()
+            }}
+            onBlur={() => {
+                if (draft !== value && onCommit(draft) === false) {
+                    setDraft(value)
+                }
+            }}
+            onClick={(e) => e.stopPropagation()}
+        />
+    )
+}
+
+interface SegmentRowProps {
+    segment: Segment
+    isActive: boolean
+    isSelected: boolean
+    hasUnsaved: boolean
+    startText: string
+    endText: string
+    transcript: string
+    translation: string
+    onPlaySegment?: (startTime: number, endTime: number, segmentId: number) => void
+    onActiveChange?: (segmentId: number | null) => void
+    onToggleSelect: (id: number, e: React.MouseEvent) => void
+    onCellEdit: (id: number, field: string, value: string | number) => void
+    onDirty?: () => void
+}
+
+// One table row. Memoized so selecting, activating or editing a row only
+// re-renders that row; all props are primitives or stable callbacks.
+const SegmentRow = memo(function SegmentRow({
+    segment,
+    isActive,
+    isSelected,
+    hasUnsaved,
+    startText,
+    endText,
+    transcript,
+    translation,
+    onPlaySegment,
+    onActiveChange,
+    onToggleSelect,
+    onCellEdit,
+    onDirty,
+}: SegmentRowProps) {
+    return (
+        <Box
+            data-id={segment.id}
+            onClick={() => onActiveChange?.(segment.id)}
+            sx={{
+                display: 'grid',
+                gridTemplateColumns: '40px 40px 40px 90px 90px 1fr 1fr',
+                py: 1.5,
+                px: 1,
+                gap: 1,
+                borderBottom: '1px solid rgba(255,255,255,0.05)',
+                cursor: 'pointer',
+                transition: 'background 0.2s',
+                bgcolor: isActive
+                    ? 'rgba(255, 193, 7, 0.1)'
+                    : hasUnsaved
+                        ? 'rgba(33, 150, 243, 0.08)'
+                        : 'transparent',
+                borderLeft: isActive ? '3px solid #ffc107' : '3px solid transparent',
+                '&:hover': {
+                    bgcolor: isActive
+                        ? 'rgba(255, 193, 7, 0.15)'
+                        : 'rgba(255,255,255,0.05)',
+                },
+            }}
+        >
+            {/* Selection checkbox */}
+            <Box onClick={(e) => onToggleSelect(segment.id, e)}>
+                <Checkbox
+                    size="small"
+                    checked={isSelected}
+                />
+            </Box>
+
+            {/* Status icon - 3 states: verified (✓), rejected (✗), unreviewed (○) */}
+            <Box sx={{ display: 'flex', alignItems: 'center', justifyContent: 'center' }}>
+                <Tooltip title={
+                    segment.is_verified ? 'Verified - Good to export' :
+                        segment.is_rejected ? 'Rejected - Will not export' :
+                            'Unreviewed'
+                }>
+                    <Box sx={{ display: 'flex', alignItems: 'center' }}>
+                        {segment.is_verified ? (
+                            <CheckCircle fontSize="small" sx={{ color: '#4caf50' }} />
+                        ) : segment.is_rejected ? (
+                            <Cancel fontSize="small" sx={{ color: '#f44336' }} />
+                        ) : (
+                            <Circle fontSize="small" sx={{ color: 'rgba(255,255,255,0.3)' }} />
+                        )}
+                    </Box>
+                </Tooltip>
+            </Box>
+
+            {/* Play button */}
+            <Box>
+                <IconButton
+                    size="small"
+                    onClick={(e) => {
+                        e.stopPropagation()
+                        onPlaySegment?.(
+                            segment.start_time_relative,
+                            segment.end_time_relative,
+                            segment.id
+                        )
+                    }}
+                    sx={{ color: isActive ? '#ffc107' : 'inherit' }}
+                >
+                    <PlayIcon fontSize="small" />
+                </IconButton>
+            </Box>
+
+            {/* Start time */}
+            <Box>
+                <DraftField
+                    value={startText}
+                    onDirty={onDirty}
+                    onCommit={(text) => {
+                        const seconds = parseTime(text)
+                        if (seconds === null) {
+                            return false
+                        }
+                        onCellEdit(segment.id, 'start_time_relative', seconds)
+                    }}
+                    sx={{
+                        width: 80,
+                        '& input': {
+                            fontFamily: 'JetBrains Mono, monospace',
+                            fontSize: 13,
+                        }
+                    }}
+                />
+            </Box>
+
+            {/* End time */}
+            <Box>
+                <DraftField
+                    value={endText}
+                    onDirty={onDirty}
+                    onCommit={(text) => {
+                        const seconds = parseTime(text)
+                        if (seconds === null) {
+                            return false
+                        }
+                        onCellEdit(segment.id, 'end_time_relative', seconds)
+                    }}
+                    sx={{
+                        width: 80,
+                        '& input': {
+                            fontFamily: 'JetBrains Mono, monospace',
+                            fontSize: 13,
+                        }
+                    }}
+                />
+            </Box>
+
+            {/* Transcript */}
+            <Box>
+                <DraftField
+                    fullWidth
+                    multiline
+                    value={transcript}
+                    onDirty={onDirty}
+                    onCommit={(text) => onCellEdit(segment.id, 'transcript', text)}
+                    placeholder="Original speech..."
+                    sx={{
+                        '& textarea': { fontSize: 14, lineHeight: 1.5 },
+                    }}
+                />
+            </Box>
+
+            {/* Translation */}
+            <Box>
+                <DraftField
+                    fullWidth
+                    multiline
+                    value={translation}
+                    onDirty={onDirty}
+                    onCommit={(text) => onCellEdit(segment.id, 'translation', text)}
+                    placeholder="English translation..."
+                    sx={{
+                        '& textarea': { fontSize: 14, lineHeight: 1.5 },
+                    }}
+                />
+            </Box>
+        </Box>
+    )
+})
+
+// Memoized so the parent's playback-time updates (fired on every wavesurfer
+// audioprocess tick) don't re-render the whole table; props are stable.
+export const SegmentTable = memo(function SegmentTable({
     segments,
     chunkId,
     activeSegmentId,
@@ -83,13 +311,17 @@ export function SegmentTable({
 }: SegmentTableProps) {
     const queryClient = useQueryClient()
     const [editedRows, setEditedRows] = useState<Map<number, Partial<Segment>>>(new Map())
+    // Mirror of editedRows updated synchronously, so a save fired right after a
+    // field's blur-commit sees that edit without waiting for a re-render
+    const editedRowsRef = useRef<Map<number, Partial<Segment>>>(new Map())
     const [selectedIds, setSelectedIds] = useState<Set<number>>(new Set())
     const tableRef = useRef<HTMLDivElement>(null)
 
     // Update segment mutation
-    const updateMutation = useMutation({
-        mutationFn: ({ id, ...data }: { id: number } & Partial<Segment>) =>
-            api.put(`/segments/${id}`, data),
+    // Save all edited rows in one request/transaction instead of a PUT per row
+    const bulkUpdateMutation = useMutation({
+        mutationFn: (updates: Array<{ id: number } & Partial<Segment>>) =>
+            api.post('/segments/bulk-update', { updates }),
         onSuccess: () => {
             queryClient.invalidateQueries({ queryKey: ['segments', chunkId] })
             onSegmentSaved?.()
@@ -130,15 +362,18 @@ export function SegmentTable({
 
     // Manual save function - called by parent via ref
     const saveAllChanges = useCallback(() => {
-        if (editedRows.size > 0) {
-            editedRows.forEach((changes, id) => {
-                if (Object.keys(changes).length > 0) {
-                    updateMutation.mutate({ id, ...changes })
-                }
-            })
+        const pending = editedRowsRef.current
+        if (pending.size > 0) {
+            const updates = Array.from(pending.entries())
+                .filter(([, changes]) => Object.keys(changes).length > 0)
+                .map(([id, changes]) => ({ id, ...changes }))
+            if (updates.length > 0) {
+                bulkUpdateMutation.mutate(updates)
+            }
+            editedRowsRef.current = new Map()
             setEditedRows(new Map())
         }
-    }, [editedRows, updateMutation])
+    }, [bulkUpdateMutation])
 
     // Expose save function to parent via ref
     useEffect(() => {
@@ -149,12 +384,11 @@ export function SegmentTable({
 
     // Handle cell edit
     const handleCellEdit = useCallback((id: number, field: string, value: string | number) => {
-        setEditedRows(prev => {
-            const newMap = new Map(prev)
-            const existing = newMap.get(id) || {}
-            newMap.set(id, { ...existing, [field]: value })
-            return newMap
-        })
+        const newMap = new Map(editedRowsRef.current)
+        const existing = newMap.get(id) || {}
+        newMap.set(id, { ...existing, [field]: value })
+        editedRowsRef.current = newMap
+        setEditedRows(newMap)
         onSegmentChange?.()
     }, [onSegmentChange])
 
@@ -167,6 +401,28 @@ export function SegmentTable({
         return row[field]
     }, [editedRows])
 
+    // Pre-format start/end strings once per segments payload instead of per row per render
+    const formattedTimes = useMemo(() => {
+        const map = new Map<number, { start: string; end: string }>()
+        segments.forEach(s => {
+            map.set(s.id, {
+                start: formatTime(s.start_time_relative),
+                end: formatTime(s.end_time_relative),
+            })
+        })
+        return map
+    }, [segments])
+
+    // Display string for a time cell (edited rows are formatted on the fly)
+    const getTimeText = useCallback((row: Segment, field: 'start_time_relative' | 'end_time_relative') => {
+        const edited = editedRows.get(row.id)
+        if (edited && field in edited) {
+            return formatTime(edited[field] as number)
+        }
+        const cached = formattedTimes.get(row.id)
+        return field === 'start_time_relative' ? cached!.start : cached!.end
+    }, [editedRows, formattedTimes])
+
     // Check if row has unsaved changes
     const hasChanges = useCallback((id: number) => {
         return editedRows.has(id) && Object.keys(editedRows.get(id) || {}).length > 0
@@ -186,13 +442,18 @@ export function SegmentTable({
         })
     }, [])
 
+    // Functional update keeps the callback stable across selection changes
     const selectAll = useCallback(() => {
-        if (selectedIds.size === segments.length) {
-            setSelectedIds(new Set())
-        } else {
-            setSelectedIds(new Set(segments.map(s => s.id)))
-        }
-    }, [segments, selectedIds.size])
+        setSelectedIds(prev =>
+            prev.size === segments.length ? new Set() : new Set(segments.map(s => s.id))
+        )
+    }, [segments])
+
+    // Footer count only changes when the segment data does
+    const verifiedCount = useMemo(
+        () => segments.reduce((count, s) => count + (s.is_verified ? 1 : 0), 0),
+        [segments]
+    )
 
     // Scroll active row into view
     useEffect(() => {
@@ -269,165 +530,24 @@ export function SegmentTable({
 
             {/* Table body - scrollable */}
             <Box sx={{ flex: 1, overflow: 'auto' }}>
-                {segments.map((segment) => {
-                    const isActive = segment.id === activeSegmentId
-                    const isSelected = selectedIds.has(segment.id)
-                    const hasUnsaved = hasChanges(segment.id)
-
-                    return (
-                        <Box
-                            key={segment.id}
-                            data-id={segment.id}
-                            onClick={() => onActiveChange?.(segment.id)}
-                            sx={{
-                                display: 'grid',
-                                gridTemplateColumns: '40px 40px 40px 90px 90px 1fr 1fr',
-                                py: 1.5,
-                                px: 1,
-                                gap: 1,
-                                borderBottom: '1px solid rgba(255,255,255,0.05)',
-                                cursor: 'pointer',
-                                transition: 'background 0.2s',
-                                bgcolor: isActive
-                                    ? 'rgba(255, 193, 7, 0.1)'
-                                    : hasUnsaved
-                                        ? 'rgba(33, 150, 243, 0.08)'
-                                        : 'transparent',
-                                borderLeft: isActive ? '3px solid #ffc107' : '3px solid transparent',
-                                '&:hover': {
-                                    bgcolor: isActive
-                                        ? 'rgba(255, 193, 7, 0.15)'
-                                        : 'rgba(255,255,255,0.05)',
-                                },
-                            }}
-                        >
-                            {/* Selection checkbox */}
-                            <Box onClick={(e) => toggleSelect(segment.id, e)}>
-                                <Checkbox
-                                    size="small"
-                                    checked={isSelected}
-                                />
-                            </Box>
-
-                            {/* Status icon - 3 states: verified (✓), rejected (✗), unreviewed (○) */}
-                            <Box sx={{ display: 'flex', alignItems: 'center', justifyContent: 'center' }}>
-                                <Tooltip title={
-                                    segment.is_verified ? 'Verified - Good to export' :
-                                        segment.is_rejected ? 'Rejected - Will not export' :
-                                            'Unreviewed'
-                                }>
-                                    <Box sx={{ display: 'flex', alignItems: 'center' }}>
-                                        {segment.is_verified ? (
-                                            <CheckCircle fontSize="small" sx={{ color: '#4caf50' }} />
-                                        ) : segment.is_rejected ? (
-                                            <Cancel fontSize="small" sx={{ color: '#f44336' }} />
-                                        ) : (
-                                            <Circle fontSize="small" sx={{ color: 'rgba(255,255,255,0.3)' }} />
-                                        )}
-                                    </Box>
-                                </Tooltip>
-                            </Box>
-
-                            {/* Play button */}
-                            <Box>
-                                <IconButton
-                                    size="small"
-                                    onClick={(e) => {
-                                        e.stopPropagation()
-                                        onPlaySegment?.(
-                                            segment.start_time_relative,
-                                            segment.end_time_relative,
-                                            segment.id
-                                        )
-                                    }}
-                                    sx={{ color: isActive ? '#ffc107' : 'inherit' }}
-                                >
-                                    <PlayIcon fontSize="small" />
-                                </IconButton>
-                            </Box>
-
-                            {/* Start time */}
-                            <Box>
-                                <TextField
-                                    size="small"
-                                    variant="standard"
-                                    value={formatTime(getValue(segment, 'start_time_relative') as number)}
-                                    onChange={(e) => {
-                                        const seconds = parseTime(e.target.value)
-                                        if (seconds !== null) {
-                                            handleCellEdit(segment.id, 'start_time_relative', seconds)
-                                        }
-                                    }}
-                                    onClick={(e) => e.stopPropagation()}
-                                    sx={{
-                                        width: 80,
-                                        '& input': {
-                                            fontFamily: 'JetBrains Mono, monospace',
-                                            fontSize: 13,
-                                        }
-                                    }}
-                                />
-                            </Box>
-
-                            {/* End time */}
-                            <Box>
-                                <TextField
-                                    size="small"
-                                    variant="standard"
-                                    value={formatTime(getValue(segment, 'end_time_relative') as number)}
-                                    onChange={(e) => {
-                                        const seconds = parseTime(e.target.value)
-                                        if (seconds !== null) {
-                                            handleCellEdit(segment.id, 'end_time_relative', seconds)
-                                        }
-                                    }}
-                                    onClick={(e) => e.stopPropagation()}
-                                    sx={{
-                                        width: 80,
-                                        '& input': {
-                                            fontFamily: 'JetBrains Mono, monospace',
-                                            fontSize: 13,
-                                        }
-                                    }}
-                                />
-                            </Box>
-
-                            {/* Transcript */}
-                            <Box>
-                                <TextField
-                                    size="small"
-                                    variant="standard"
-                                    fullWidth
-                                    multiline
-                                    value={getValue(segment, 'transcript') as string}
-                                    onChange={(e) => handleCellEdit(segment.id, 'transcript', e.target.value)}
-                                    onClick={(e) => e.stopPropagation()}
-                                    placeholder="Original speech..."
-                                    sx={{
-                                        '& textarea': { fontSize: 14, lineHeight: 1.5 },
-                                    }}
-                                />
-                            </Box>
-
-                            {/* Translation */}
-                            <Box>
-                                <TextField
-                                    size="small"
-                                    variant="standard"
-                                    fullWidth
-                                    multiline
-                                    value={getValue(segment, 'translation') as string}
-                                    onChange={(e) => handleCellEdit(segment.id, 'translation', e.target.value)}
-                                    onClick={(e) => e.stopPropagation()}
-                                    placeholder="English translation..."
-                                    sx={{
-                                        '& textarea': { fontSize: 14, lineHeight: 1.5 },
-                                    }}
-                                />
-                            </Box>
-                        </Box>
-                    )
-                })}
+                {segments.map((segment) => (
+                    <SegmentRow
+                        key={segment.id}
+                        segment={segment}
+                        isActive={segment.id === activeSegmentId}
+                        isSelected={selectedIds.has(segment.id)}
+                        hasUnsaved={hasChanges(segment.id)}
+                        startText={getTimeText(segment, 'start_time_relative')}
+                        endText={getTimeText(segment, 'end_time_relative')}
+                        transcript={getValue(segment, 'transcript') as string}
+                        translation={getValue(segment, 'translation') as string}
+                        onPlaySegment={onPlaySegment}
+                        onActiveChange={onActiveChange}
+                        onToggleSelect={toggleSelect}
+                        onCellEdit={handleCellEdit}
+                        onDirty={onSegmentChange}
+                    />
+                ))}
             </Box>
 
             {/* Footer with count */}
@@ -441,8 +561,8 @@ export function SegmentTable({
                 color: 'rgba(255,255,255,0.5)'
             }}>
                 <span>{segments.length} segments</span>
-                <span>{segments.filter(s => s.is_verified).length} / {segments.length} verified</span>
+                <span>{verifiedCount} / {segments.length} verified</span>
             </Box>
         </Box>
     )
-}
+})
@@ -10,7 +10,7 @@
  * - Minimap for navigation
  */
 
-import { useEffect, useRef, forwardRef, useImperativeHandle } from 'react'
+import { memo, useEffect, useRef, forwardRef, useImperativeHandle } from 'react'
 import WaveSurfer from 'wavesurfer.js'
 import RegionsPlugin, { Region } from 'wavesurfer.js/dist/plugins/regions.esm.js'
 import TimelinePlugin from 'wavesurfer.js/dist/plugins/timeline.esm.js'
@@ -57,7 +57,9 @@ const COLORS = {
     cursor: '#fff',
 }
 
-export const WaveformViewer = forwardRef<WaveformViewerRef, WaveformViewerProps>(
+// Memoized so parent re-renders (playback clock, segment edits) do not touch
+// the waveform; audio is only re-fetched when audioUrl changes.
+export const WaveformViewer = memo(forwardRef<WaveformViewerRef, WaveformViewerProps>(
     ({
         audioUrl,
         segments = [],
@@ -313,6 +315,6 @@ export const WaveformViewer = forwardRef<WaveformViewerRef, WaveformViewerProps>
             </Box>
         )
     }
-)
+))
 
 WaveformViewer.displayName = 'WaveformViewer'
@@ -7,7 +7,7 @@
  * Back button returns to channel list (not dashboard).
  */
 
-import React from 'react'
+import React, { useMemo } from 'react'
 import {
     Box,
     Typography,
@@ -133,8 +133,14 @@ export function ChannelPage({
         queryFn: () => api.get('/channels/stats').then(res => res.data).catch(() => []),
     })
 
+    // Index stats once per fetch instead of a linear find per rendered card
+    const channelStatsById = useMemo(
+        () => new Map(channelStats.map(s => [s.channel_id, s])),
+        [channelStats]
+    )
+
     const getChannelStats = (channelId: number): ChannelStats | undefined => {
-        return channelStats.find(s => s.channel_id === channelId)
+        return channelStatsById.get(channelId)
     }
 
     // ==================== VIDEO LIST VIEW ====================
@@ -162,8 +168,13 @@ export function ChannelPage({
         refetchOnMount: 'always',  // Always refetch when tab becomes visible
     })
 
+    const videoStatsById = useMemo(
+        () => new Map(videoStats.map(s => [s.video_id, s])),
+        [videoStats]
+    )
+
     const getVideoStats = (videoId: number): VideoStats | undefined => {
-        return videoStats.find(s => s.video_id === videoId)
+        return videoStatsById.get(videoId)
     }
 
     // ==================== MUTATIONS ====================
@@ -6,7 +6,7 @@
  * Real-time updates via SSE.
  */
 
-import { useState, useEffect, useCallback } from 'react'
+import { useState, useEffect, useCallback, useMemo } from 'react'
 import {
     Box,
     Typography,
@@ -63,6 +63,9 @@ interface QueueStats {
     pending_chunks: number
 }
 
+// Coalesce bursts of SSE job events into a single refetch
+const SSE_REFRESH_DEBOUNCE_MS = 1000
+
 // Helper to format duration
 const formatDuration = (seconds: number): string => {
     const hours = Math.floor(seconds / 3600)
@@ -74,6 +77,22 @@ const formatDuration = (seconds: number): string => {
     return `${mins}:${secs.toString().padStart(2, '0')}`
 }
 
+// Calculate progress for a video
+const getProgress = (video: VideoQueueStatus): number => {
+    if (video.total_chunks === 0) return 0
+    const processed = video.completed_chunks
+    return (processed / video.total_chunks) * 100
+}
+
+// Get status priority for sorting (processing > queued > failed > pending > ready)
+const getStatusPriority = (video: VideoQueueStatus): number => {
+    if (video.processing_chunks > 0) return 1
+    if (video.queued_chunks > 0) return 2
+    if (video.failed_chunks > 0) return 3
+    if (video.pending_chunks > 0) return 4
+    return 5 // Ready
+}
+
 interface PreprocessingPageProps {
     userId: number
 }
@@ -116,6 +135,16 @@ export function PreprocessingPage({ userId }: PreprocessingPageProps) {
     // SSE connection for real-time updates
     useEffect(() => {
         const eventSource = new EventSource('/api/queue/status')
+        let refreshTimer: ReturnType<typeof setTimeout> | null = null
+
+        const scheduleRefresh = () => {
+            if (refreshTimer !== null) return
+            refreshTimer = setTimeout(() => {
+                refreshTimer = null
+                queryClient.invalidateQueries({ queryKey: ['queue-summary'] })
+                queryClient.invalidateQueries({ queryKey: ['queue-stats'] })
+            }, SSE_REFRESH_DEBOUNCE_MS)
+        }
 
         eventSource.onopen = () => {
             setSseConnected(true)
@@ -128,9 +157,8 @@ export function PreprocessingPage({ userId }: PreprocessingPageProps) {
                 if (data.event === 'job_started' ||
                     data.event === 'job_completed' ||
                     data.event === 'job_failed') {
-                    // Refetch data on any job status change
-                    queryClient.invalidateQueries({ queryKey: ['queue-summary'] })
-                    queryClient.invalidateQueries({ queryKey: ['queue-stats'] })
+                    // Refetch data on job status changes (batched)
+                    scheduleRefresh()
                 }
             } catch (e) {
                 // Ignore parse errors (heartbeats, etc.)
@@ -142,6 +170,7 @@ export function PreprocessingPage({ userId }: PreprocessingPageProps) {
         }
 
         return () => {
+            if (refreshTimer !== null) clearTimeout(refreshTimer)
             eventSource.close()
         }
     }, [queryClient])
@@ -261,13 +290,6 @@ export function PreprocessingPage({ userId }: PreprocessingPageProps) {
         )
     }
 
-    // Calculate progress for a video
-    const getProgress = (video: VideoQueueStatus): number => {
-        if (video.total_chunks === 0) return 0
-        const processed = video.completed_chunks
-        return (processed / video.total_chunks) * 100
-    }
-
     // Sorting handler
     const handleSort = (column: 'title' | 'channel' | 'duration' | 'progress' | 'status') => {
         if (sortBy === column) {
@@ -278,17 +300,8 @@ export function PreprocessingPage({ userId }: PreprocessingPageProps) {
         }
     }
 
-    // Get status priority for sorting (processing > queued > failed > pending > ready)
-    const getStatusPriority = (video: VideoQueueStatus): number => {
-        if (video.processing_chunks > 0) return 1
-        if (video.queued_chunks > 0) return 2
-        if (video.failed_chunks > 0) return 3
-        if (video.pending_chunks > 0) return 4
-        return 5 // Ready
-    }
-
-    // Sort videos
-    const sortedVideos = videos ? [...videos].sort((a, b) => {
+    // Sort videos (only when the data or sort settings change, not on every render)
+    const sortedVideos = useMemo(() => videos ? [...videos].sort((a, b) => {
         let cmp = 0
         switch (sortBy) {
             case 'title':
@@ -308,7 +321,7 @@ export function PreprocessingPage({ userId }: PreprocessingPageProps) {
                 break
         }
         return sortDir === 'asc' ? cmp : -cmp
-    }) : []
+    }) : [], [videos, sortBy, sortDir])
 
     if (isLoading) {
         return (
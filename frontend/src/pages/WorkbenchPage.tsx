@@ -68,6 +68,19 @@ interface Segment {
 
 // Channel interface removed - not used in this component
 
+// Format time as M:SS.mmm. Works in integer milliseconds so the 100ms-quantized
+// playback clock doesn't render float noise (2.3 % 1 -> .299).
+function formatTime(seconds: number): string {
+    const totalMs = Math.round(seconds * 1000)
+    const mins = Math.floor(totalMs / 60000)
+    const secs = Math.floor(totalMs / 1000) % 60
+    const ms = totalMs % 1000
+    return `${mins}:${secs.toString().padStart(2, '0')}.${ms.toString().padStart(3, '0')}`
+}
+
+// Stable fallback so the memoized SegmentTable isn't handed a fresh [] every render
+const NO_SEGMENTS: Segment[] = []
+
 interface WorkbenchPageProps {
     userId: number
     username: string
@@ -132,7 +145,7 @@ export function WorkbenchPage({ userId, username, preselectedVideoId, preselecte
     const loadingChunk = preselectedChunkId ? loadingPreselected : loadingNext
 
     // Fetch segments for current chunk
-    const { data: segments = [], isLoading: loadingSegments, refetch: refetchSegments } = useQuery<Segment[]>({
+    const { data: segments = NO_SEGMENTS, isLoading: loadingSegments, refetch: refetchSegments } = useQuery<Segment[]>({
         queryKey: ['segments', currentChunk?.id],
         queryFn: () => api.get(`/chunks/${currentChunk?.id}/segments`).then(res => res.data),
         enabled: !!currentChunk,
@@ -216,18 +229,14 @@ export function WorkbenchPage({ userId, username, preselectedVideoId, preselecte
         [segments.length, verifiedCount, rejectedCount]
     )
 
+    // Duration only changes per chunk; don't re-format it on every clock tick
+    const durationText = useMemo(() => formatTime(duration), [duration])
+
     // Helpers
     const showSnackbar = (message: string, severity: 'success' | 'error' | 'info') => {
         setSnackbar({ open: true, message, severity })
     }
 
-    const formatTime = (seconds: number): string => {
-        const mins = Math.floor(seconds / 60)
-        const secs = Math.floor(seconds % 60)
-        const ms = Math.floor((seconds % 1) * 1000)
-        return `${mins}:${secs.toString().padStart(2, '0')}.${ms.toString().padStart(3, '0')}`
-    }
-
     // Start working on a chunk
     const startChunk = async (chunk: Chunk) => {
         try {
@@ -293,6 +302,18 @@ export function WorkbenchPage({ userId, username, preselectedVideoId, preselecte
         // TODO: Implement segment timestamp update via API
     }, [])
 
+    // Playback clock (from waveform). WaveSurfer fires audioprocess every
+    // animation frame; quantizing to 100ms lets React bail out of the
+    // identical-state updates so the page re-renders ~10x/s, not ~60x/s.
+    const handleTimeUpdate = useCallback((time: number) => {
+        setCurrentTime(Math.floor(time * 10) / 10)
+    }, [])
+
+    // Region click callback (from waveform)
+    const handleRegionClick = useCallback((regionId: string) => {
+        setActiveSegmentId(Number(regionId))
+    }, [])
+
     // Handle segment update from table
     const handleSegmentChange = useCallback(() => {
         setHasUnsavedChanges(true)
@@ -559,10 +580,10 @@ export function WorkbenchPage({ userId, username, preselectedVideoId, preselecte
                         activeSegmentId={activeSegmentId}
                         zoom={zoom}
                         onPlayPause={setIsPlaying}
-                        onTimeUpdate={setCurrentTime}
+                        onTimeUpdate={handleTimeUpdate}
                         onDurationChange={setDuration}
                         onRegionUpdate={handleRegionUpdate}
-                        onRegionClick={(id) => setActiveSegmentId(Number(id))}
+                        onRegionClick={handleRegionClick}
                     />
                 </Box>
 
@@ -575,7 +596,7 @@ export function WorkbenchPage({ userId, username, preselectedVideoId, preselecte
                     </IconButton>
 
                     <Box className="time-display">
-                        {formatTime(currentTime)} / {formatTime(duration)}
+                        {formatTime(currentTime)} / {durationText}
                     </Box>
 
                     <Tooltip title="Skip 5s forward (Ctrl+→)">
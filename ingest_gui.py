@@ -16,11 +16,16 @@ Usage:
     python ingest_gui.py
 """
 
+import io
 import os
 import sys
 import threading
+import time
+import uuid
+from urllib.parse import urlparse, parse_qs
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Dict, Optional, List, Tuple
 from dataclasses import dataclass, field
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
@@ -50,6 +55,15 @@ API_BASE = os.getenv("API_BASE", "http://localhost:8000/api")
 DATA_ROOT = Path(os.getenv("DATA_ROOT", "./data"))
 TEMP_DIR = DATA_ROOT / "temp"
 
+# Parallel yt-dlp metadata extractions when fetching several URLs
+FETCH_WORKERS = 4
+
+# Seconds a resolved channel (URL -> channel dict) is reused before re-querying
+CHANNEL_CACHE_TTL = 300
+
+# Seconds fetched playlist/channel metadata is reused before re-hitting YouTube
+METADATA_CACHE_TTL = 3600
+
 
 # =============================================================================
 # DATA CLASSES
@@ -73,23 +87,106 @@ class BatchProgress:
     failed_videos: List[Tuple[str, str, str]] = field(default_factory=list)  # (title, error, url)
 
 
+# =============================================================================
+# METADATA CACHE
+# =============================================================================
+
+_metadata_cache: Dict[str, Tuple[float, List[VideoMetadata]]] = {}
+_metadata_cache_lock = threading.Lock()
+
+
+def canonical_url(url: str) -> str:
+    """
+    Reduce a YouTube URL to a canonical cache key.
+    
+    Equivalent URLs (youtu.be vs watch?v=, tracking params, trailing slash)
+    map to the same key: yt:playlist:<id>, yt:video:<id> or yt:path:<path>.
+    Non-YouTube URLs are keyed by the URL itself, so different sites with
+    the same path never share a cache entry.
+    """
+    url = url.strip()
+    parsed = urlparse(url)
+    query = parse_qs(parsed.query)
+    host = parsed.netloc.lower()
+    path = parsed.path.rstrip("/")
+    
+    if host == "youtu.be" or host.endswith(".youtu.be"):
+        return f"yt:video:{path.lstrip('/')}" if path else url
+    if not (host == "youtube.com" or host.endswith(".youtube.com")):
+        return url
+    
+    # yt-dlp treats watch?v=X&list=Y as the playlist
+    if "list" in query:
+        return f"yt:playlist:{query['list'][0]}"
+    if "v" in query:
+        return f"yt:video:{query['v'][0]}"
+    if path.startswith("/shorts/"):
+        return f"yt:video:{path.split('/')[2]}"
+    if path:
+        # Channel pages: /@handle, /channel/ID, /c/name, /user/name (+ tab)
+        return f"yt:path:{path}"
+    return url
+
+
+def fetch_playlist_metadata_cached(url: str) -> List[VideoMetadata]:
+    """
+    fetch_playlist_metadata with a cache keyed by canonical_url.
+    
+    Entries expire after METADATA_CACHE_TTL so new uploads are picked up.
+    Empty results (failed fetches) are not cached, so they are retried.
+    """
+    key = canonical_url(url)
+    with _metadata_cache_lock:
+        cached = _metadata_cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < METADATA_CACHE_TTL:
+        return list(cached[1])
+    
+    videos = fetch_playlist_metadata(url)
+    if videos:
+        with _metadata_cache_lock:
+            _metadata_cache[key] = (time.monotonic(), list(videos))
+    return videos
+
+
 # =============================================================================
 # API FUNCTIONS
 # =============================================================================
 
-def check_duplicate(url: str) -> dict:
-    """Check if URL already exists in database."""
+# One pooled session per thread (requests.Session isn't thread-safe, and the
+# health pings, duplicate checks, downloads and uploads run on separate
+# threads), so each reuses keep-alive connections instead of reconnecting
+_thread_local = threading.local()
+
+
+def _get_session() -> requests.Session:
+    """Return this thread's API session, creating it on first use."""
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        _thread_local.session = session
+    return session
+
+
+def check_duplicates(urls: List[str]) -> Optional[Dict[str, int]]:
+    """
+    Check which URLs already exist in database, in one request.
+    
+    Returns:
+        Mapping of existing URL -> video ID, or None if the check failed
+    """
     try:
-        resp = requests.get(f"{API_BASE}/videos/check", params={"url": url}, timeout=10)
-        return resp.json()
+        resp = _get_session().post(f"{API_BASE}/videos/check-batch", json={"urls": urls}, timeout=30)
+        resp.raise_for_status()
+        return resp.json().get("existing", {})
     except Exception as e:
-        return {"exists": False, "message": str(e)}
+        print(f"Duplicate check error: {e}")
+        return None
 
 
 def get_users() -> List[dict]:
     """Fetch user list from API."""
     try:
-        resp = requests.get(f"{API_BASE}/users", timeout=10)
+        resp = _get_session().get(f"{API_BASE}/users", timeout=10)
         resp.raise_for_status()
         data = resp.json()
         return data if isinstance(data, list) else []
@@ -105,7 +202,7 @@ def check_server_health() -> Tuple[bool, str]:
         (is_healthy, message)
     """
     try:
-        resp = requests.get(f"{API_BASE.replace('/api', '')}/health", timeout=5)
+        resp = _get_session().get(f"{API_BASE.replace('/api', '')}/health", timeout=5)
         if resp.status_code == 200:
             return True, "Connected"
         return False, f"Status {resp.status_code}"
@@ -120,7 +217,7 @@ def check_server_health() -> Tuple[bool, str]:
 def get_channels() -> List[dict]:
     """Fetch channel list from API."""
     try:
-        resp = requests.get(f"{API_BASE}/channels", timeout=10)
+        resp = _get_session().get(f"{API_BASE}/channels", timeout=10)
         resp.raise_for_status()
         data = resp.json()
         if isinstance(data, list) and len(data) > 0:
@@ -130,10 +227,18 @@ def get_channels() -> List[dict]:
         return []
 
 
+_channel_cache: Dict[str, Tuple[float, dict]] = {}
+_channel_cache_lock = threading.Lock()
+
+
 def get_or_create_channel(name: str, url: str) -> Optional[dict]:
     """
     Get existing channel by URL, or create a new one.
     
+    Resolved channels are cached per URL for CHANNEL_CACHE_TTL seconds, so a
+    batch of videos from the same channel costs one lookup instead of one
+    (or two) per video.
+    
     Args:
         name: Channel display name
         url: YouTube channel URL
@@ -141,14 +246,28 @@ def get_or_create_channel(name: str, url: str) -> Optional[dict]:
     Returns:
         Channel dict with 'id' key, or None if failed
     """
+    with _channel_cache_lock:
+        cached = _channel_cache.get(url)
+    if cached and time.monotonic() - cached[0] < CHANNEL_CACHE_TTL:
+        return cached[1]
+    
+    channel = _fetch_or_create_channel(name, url)
+    if channel:
+        with _channel_cache_lock:
+            _channel_cache[url] = (time.monotonic(), channel)
+    return channel
+
+
+def _fetch_or_create_channel(name: str, url: str) -> Optional[dict]:
+    """Uncached channel lookup/creation against the API."""
     try:
         # Try to find existing channel by URL
-        resp = requests.get(f"{API_BASE}/channels/by-url", params={"url": url}, timeout=10)
+        resp = _get_session().get(f"{API_BASE}/channels/by-url", params={"url": url}, timeout=10)
         if resp.status_code == 200:
             return resp.json()
         
         # Channel not found, create it
-        resp = requests.post(
+        resp = _get_session().post(
             f"{API_BASE}/channels",
             json={"name": name, "url": url},
             timeout=10
@@ -157,7 +276,7 @@ def get_or_create_channel(name: str, url: str) -> Optional[dict]:
             return resp.json()
         elif resp.status_code == 409:
             # Race condition: channel was created between check and create
-            resp = requests.get(f"{API_BASE}/channels/by-url", params={"url": url}, timeout=10)
+            resp = _get_session().get(f"{API_BASE}/channels/by-url", params={"url": url}, timeout=10)
             if resp.status_code == 200:
                 return resp.json()
         
@@ -167,6 +286,57 @@ def get_or_create_channel(name: str, url: str) -> Optional[dict]:
         return None
 
 
+class _MultipartFileStream:
+    """
+    Read-only multipart/form-data body that streams the file from disk.
+    
+    requests' files= encodes the whole upload into one bytes object before
+    sending. This wraps the form fields and the open file so the body is
+    read in small blocks, with a known length for the Content-Length header.
+    """
+    
+    def __init__(self, fields: dict, field_name: str, file_path: Path, content_type: str):
+        self.boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        
+        head = b"".join(
+            (
+                f"--{self.boundary}\r\n"
+                f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
+                f"{value}\r\n"
+            ).encode("utf-8")
+            for name, value in fields.items()
+        )
+        head += (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field_name}"; filename="{file_path.name}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode("utf-8")
+        tail = f"\r\n--{self.boundary}--\r\n".encode("utf-8")
+        
+        self._file = open(file_path, "rb")
+        self._parts = [io.BytesIO(head), self._file, io.BytesIO(tail)]
+        # Size from the already-open handle: no second path lookup, and it's
+        # the size of exactly the file we'll stream
+        self._length = len(head) + os.fstat(self._file.fileno()).st_size + len(tail)
+    
+    def __len__(self) -> int:
+        return self._length
+    
+    def read(self, size: int = -1) -> bytes:
+        out = b""
+        while self._parts and (size < 0 or len(out) < size):
+            block = self._parts[0].read(-1 if size < 0 else size - len(out))
+            if not block:
+                self._parts.pop(0)
+                continue
+            out += block
+        return out
+    
+    def close(self):
+        self._file.close()
+
+
 def upload_video(
     file_path: Path,
     title: str,
@@ -175,21 +345,32 @@ def upload_video(
     channel_id: int,
     user_id: int
 ) -> dict:
-    """Upload video to server."""
+    """Upload video to server, streaming the audio file from disk."""
     try:
-        with open(file_path, "rb") as f:
-            resp = requests.post(
+        body = _MultipartFileStream(
+            fields={
+                "title": title,
+                "duration_seconds": duration,
+                "original_url": url,
+                "channel_id": channel_id,
+            },
+            field_name="audio",
+            file_path=file_path,
+            content_type="audio/mp4",
+        )
+        try:
+            resp = _get_session().post(
                 f"{API_BASE}/videos/upload",
-                headers={"X-User-ID": str(user_id)},
-                files={"audio": (file_path.name, f, "audio/mp4")},
-                data={
-                    "title": title,
-                    "duration_seconds": duration,
-                    "original_url": url,
-                    "channel_id": channel_id,
+                headers={
+                    "X-User-ID": str(user_id),
+                    "Content-Type": body.content_type,
+                    "Content-Length": str(len(body)),
                 },
+                data=body,
                 timeout=300  # 5 min timeout for large files
             )
+        finally:
+            body.close()
         return resp.json()
     except Exception as e:
         return {"error": str(e)}
@@ -513,6 +694,47 @@ class IngestGUI:
                 urls.append(url)
         return urls
     
+    def _fetch_many(self, urls: List[str], found_message) -> List[VideoMetadata]:
+        """
+        Fetch metadata for several URLs concurrently (runs in a worker thread).
+        
+        Results keep the input URL order and are deduplicated by original_url.
+        
+        Args:
+            urls: Video or playlist URLs
+            found_message: Callable (url, count) -> log line for a successful fetch
+            
+        Returns:
+            Unique videos across all URLs
+        """
+        results: List[List[VideoMetadata]] = [[] for _ in urls]
+        workers = max(1, min(FETCH_WORKERS, len(urls)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(fetch_playlist_metadata_cached, url): i
+                for i, url in enumerate(urls)
+            }
+            # Log as each fetch finishes so progress shows up before the slowest URL
+            for done, future in enumerate(as_completed(futures), 1):
+                i = futures[future]
+                url = urls[i]
+                try:
+                    results[i] = future.result()
+                    self._log(f"[{done}/{len(urls)}]" + found_message(url, len(results[i])))
+                except Exception as e:
+                    self._log(f"[{done}/{len(urls)}]  ✗ Failed: {url[:50]}... ({e})")
+        all_videos = [v for videos in results for v in videos]
+        
+        # Deduplicate by original_url
+        seen = set()
+        unique_videos = []
+        for v in all_videos:
+            if v.original_url not in seen:
+                seen.add(v.original_url)
+                unique_videos.append(v)
+        
+        return unique_videos
+    
     # =========================================================================
     # TAB 1: Fetch Multiple URLs
     # =========================================================================
@@ -530,23 +752,10 @@ class IngestGUI:
         self._clear_list()
         
         def fetch():
-            all_videos = []
-            for url in urls:
-                try:
-                    videos = fetch_playlist_metadata(url)
-                    all_videos.extend(videos)
-                    self._log(f"  Found {len(videos)} video(s) from {url[:50]}...")
-                except Exception as e:
-                    self._log(f"  ✗ Failed: {url[:50]}... ({e})")
-            
-            # Deduplicate by original_url
-            seen = set()
-            unique_videos = []
-            for v in all_videos:
-                if v.original_url not in seen:
-                    seen.add(v.original_url)
-                    unique_videos.append(v)
-            
+            unique_videos = self._fetch_many(
+                urls,
+                lambda url, n: f"  Found {n} video(s) from {url[:50]}..."
+            )
             self.root.after(0, lambda: self._update_video_list(unique_videos))
         
         threading.Thread(target=fetch, daemon=True).start()
@@ -568,23 +777,10 @@ class IngestGUI:
         self._clear_list()
         
         def fetch():
-            all_videos = []
-            for url in urls:
-                try:
-                    videos = fetch_playlist_metadata(url)
-                    all_videos.extend(videos)
-                    self._log(f"  Found {len(videos)} video(s) from playlist")
-                except Exception as e:
-                    self._log(f"  ✗ Failed: {url[:50]}... ({e})")
-            
-            # Deduplicate
-            seen = set()
-            unique_videos = []
-            for v in all_videos:
-                if v.original_url not in seen:
-                    seen.add(v.original_url)
-                    unique_videos.append(v)
-            
+            unique_videos = self._fetch_many(
+                urls,
+                lambda url, n: f"  Found {n} video(s) from playlist"
+            )
             self.root.after(0, lambda: self._update_video_list(unique_videos))
         
         threading.Thread(target=fetch, daemon=True).start()
@@ -605,7 +801,7 @@ class IngestGUI:
         
         def fetch():
             try:
-                videos = fetch_playlist_metadata(url)
+                videos = fetch_playlist_metadata_cached(url)
                 
                 if videos:
                     # Extract channel info from first video
@@ -640,10 +836,11 @@ class IngestGUI:
         self.videos = videos
         self.tree.delete(*self.tree.get_children())
         
-        for video in videos:
+        # Row iid is the index into self.videos, so rows can be addressed directly
+        for i, video in enumerate(videos):
             duration_str = f"{video.duration_seconds // 60}:{video.duration_seconds % 60:02d}"
             channel = video.channel_name or "Unknown"
-            self.tree.insert("", tk.END, values=(video.title, duration_str, channel, "Ready"))
+            self.tree.insert("", tk.END, iid=str(i), values=(video.title, duration_str, channel, "Ready"))
         
         # Auto-detect channel from first video if not already set
         if videos and not self.detected_channel:
@@ -708,11 +905,14 @@ class IngestGUI:
         self._log("Checking for duplicates...")
         
         def check():
+            existing = check_duplicates([video.original_url for video in self.videos])
+            if existing is None:
+                self._log("Duplicate check failed (server unreachable?)")
+                return
+            
             for i, video in enumerate(self.videos):
-                item = self.tree.get_children()[i]
-                result = check_duplicate(video.original_url)
-                
-                if result.get("exists"):
+                item = str(i)
+                if video.original_url.strip() in existing:
                     self.root.after(0, lambda it=item: self.tree.set(it, "status", "⚠️ Duplicate"))
                 else:
                     self.root.after(0, lambda it=item: self.tree.set(it, "status", "✓ OK"))
@@ -755,81 +955,100 @@ class IngestGUI:
         self.is_downloading = True
         self.download_btn.config(state=tk.DISABLED)
         
-        def download_all():
-            for item in selection:
-                idx = self.tree.index(item)
-                video = self.videos[idx]
-                
-                # Skip duplicates
-                status = self.tree.set(item, "status")
-                if "Duplicate" in status:
-                    self._log(f"⏭ Skipping duplicate: {video.title[:50]}...")
-                    self.progress.skipped += 1
-                    self._update_progress()
-                    continue
+        # Downloads (yt-dlp, network-in) and uploads (API, network-out) are
+        # pipelined: video N+1 downloads while video N uploads
+        progress_lock = threading.Lock()
+        
+        def record_failure(item, video, error_msg):
+            self._log(f"✗ Failed: {video.title[:50]}... - {error_msg}")
+            self.root.after(0, lambda it=item, err=error_msg[:30]: self.tree.set(it, "status", f"✗ {err}"))
+            with progress_lock:
+                self.progress.failed += 1
+                self.progress.failed_videos.append((video.title, error_msg, video.original_url))
+            self._update_progress()
+        
+        def upload_one(item, video, result, channel_id):
+            self.root.after(0, lambda it=item: self.tree.set(it, "status", "⏳ Uploading..."))
+            try:
+                upload_result = upload_video(
+                    result.file_path,
+                    result.title,
+                    result.duration_seconds,
+                    result.original_url,
+                    channel_id,
+                    user_id
+                )
                 
-                # Update status
-                self.root.after(0, lambda it=item: self.tree.set(it, "status", "⏳ Downloading..."))
+                if "video_id" not in upload_result:
+                    error = upload_result.get("error", upload_result.get("detail", "Unknown error"))
+                    raise Exception(f"Upload failed: {error}")
                 
+                self.root.after(0, lambda it=item: self.tree.set(it, "status", "✓ Complete"))
+                self._log(f"✓ Uploaded: {video.title[:50]}...")
+                with progress_lock:
+                    self.progress.completed += 1
+                self._update_progress()
+            except Exception as e:
+                record_failure(item, video, str(e))
+            finally:
+                # Clean up temp file
                 try:
-                    # Download
-                    result = download_audio(
-                        video.original_url,
-                        TEMP_DIR,
-                        lambda msg: self._log(f"  {msg}")
-                    )
-                    
-                    if not result or not result.file_path:
-                        raise Exception("Download returned no file")
-                    
-                    # Get or create channel for THIS SPECIFIC VIDEO
-                    # CRITICAL: Always use each video's own channel metadata,
-                    # NOT the cached detected_channel from first video
-                    channel_id = None
-                    if result.channel_url:
-                        ch = get_or_create_channel(result.channel_name or "Unknown", result.channel_url)
-                        if ch:
-                            channel_id = ch["id"]
-                            self._log(f"  → Channel: {ch['name']}")
-                    
-                    if not channel_id:
-                        raise Exception("Could not determine channel from video metadata")
-                    
-                    # Upload
-                    self.root.after(0, lambda it=item: self.tree.set(it, "status", "⏳ Uploading..."))
+                    if result.file_path and result.file_path.exists():
+                        result.file_path.unlink()
+                except Exception:
+                    pass
+        
+        def download_all():
+            with ThreadPoolExecutor(max_workers=1) as uploader:
+                pending_upload = None
+                for item in selection:
+                    # iid is the row's index into self.videos (see _update_video_list)
+                    video = self.videos[int(item)]
                     
-                    upload_result = upload_video(
-                        result.file_path,
-                        result.title,
-                        result.duration_seconds,
-                        result.original_url,
-                        channel_id,
-                        user_id
-                    )
+                    # Skip duplicates
+                    status = self.tree.set(item, "status")
+                    if "Duplicate" in status:
+                        self._log(f"⏭ Skipping duplicate: {video.title[:50]}...")
+                        with progress_lock:
+                            self.progress.skipped += 1
+                        self._update_progress()
+                        continue
                     
-                    if "video_id" in upload_result:
-                        self.root.after(0, lambda it=item: self.tree.set(it, "status", "✓ Complete"))
-                        self._log(f"✓ Uploaded: {video.title[:50]}...")
-                        self.progress.completed += 1
-                    else:
-                        error = upload_result.get("error", upload_result.get("detail", "Unknown error"))
-                        raise Exception(f"Upload failed: {error}")
+                    # Update status
+                    self.root.after(0, lambda it=item: self.tree.set(it, "status", "⏳ Downloading..."))
                     
-                    # Clean up temp file
                     try:
-                        if result.file_path and result.file_path.exists():
-                            result.file_path.unlink()
-                    except Exception:
-                        pass
+                        # Download
+                        result = download_audio(
+                            video.original_url,
+                            TEMP_DIR,
+                            lambda msg: self._log(f"  {msg}")
+                        )
+                        
+                        if not result or not result.file_path:
+                            raise Exception("Download returned no file")
+                        
+                        # Get or create channel for THIS SPECIFIC VIDEO
+                        # CRITICAL: Always use each video's own channel metadata,
+                        # NOT the cached detected_channel from first video
+                        channel_id = None
+                        if result.channel_url:
+                            ch = get_or_create_channel(result.channel_name or "Unknown", result.channel_url)
+                            if ch:
+                                channel_id = ch["id"]
+                                self._log(f"  → Channel: {ch['name']}")
+                        
+                        if not channel_id:
+                            raise Exception("Could not determine channel from video metadata")
+                    except Exception as e:
+                        record_failure(item, video, str(e))
+                        continue
                     
-                except Exception as e:
-                    error_msg = str(e)
-                    self._log(f"✗ Failed: {video.title[:50]}... - {error_msg}")
-                    self.root.after(0, lambda it=item, err=error_msg[:30]: self.tree.set(it, "status", f"✗ {err}"))
-                    self.progress.failed += 1
-                    self.progress.failed_videos.append((video.title, error_msg, video.original_url))
-                
-                self._update_progress()
+                    # Upload in the background and move on to the next download.
+                    # At most one upload in flight, so at most two temp files on disk.
+                    if pending_upload:
+                        pending_upload.result()
+                    pending_upload = uploader.submit(upload_one, item, video, result, channel_id)
             
             # Summary
             self._log("=" * 50)
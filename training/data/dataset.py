@@ -8,6 +8,7 @@ import logging
 from pathlib import Path
 from typing import Dict, Any, Optional, Union
 
+import numpy as np
 import torch
 import torchaudio
 import pandas as pd
@@ -48,6 +49,9 @@ class VietEngDataset(Dataset):
         self.max_audio_length = max_audio_length
         self.max_samples = int(max_audio_length * sample_rate)
         
+        # Resample transforms keyed by source rate (built once, reused per item)
+        self._resamplers: Dict[int, torchaudio.transforms.Resample] = {}
+        
         # Load data
         self.data = pd.read_csv(self.csv_path)
         logger.info(f"Loaded {len(self.data)} samples from {self.csv_path.name}")
@@ -76,7 +80,10 @@ class VietEngDataset(Dataset):
         
         # Resample if needed
         if sr != self.sample_rate:
-            resampler = torchaudio.transforms.Resample(sr, self.sample_rate)
+            resampler = self._resamplers.get(sr)
+            if resampler is None:
+                resampler = torchaudio.transforms.Resample(sr, self.sample_rate)
+                self._resamplers[sr] = resampler
             waveform = resampler(waveform)
         
         # Flatten to 1D
@@ -131,7 +138,6 @@ class VietEngDatasetPreprocessed(Dataset):
         feature_path = self.features_dir / f"{row['id']}.npy"
         
         if feature_path.exists():
-            import numpy as np
             audio = torch.from_numpy(np.load(feature_path))
         else:
             # Fallback to loading from audio
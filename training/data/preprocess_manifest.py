@@ -72,6 +72,27 @@ def clean_text(text: str) -> str:
     return text
 
 
+def clean_text_series(texts: pd.Series) -> pd.Series:
+    """
+    Vectorized clean_text over a whole column.
+    
+    Same steps as strip_markdown + normalize_whitespace, but each regex runs
+    once over the Series instead of once per row. Non-string values become "".
+    """
+    texts = texts.astype(object)
+    
+    # Remove bracketed annotations and markdown emphasis
+    texts = texts.str.replace(r'\[[^\]]*\]', '', regex=True)
+    texts = texts.str.replace(r'\*\*([^*]+)\*\*', r'\1', regex=True)
+    texts = texts.str.replace(r'\*([^*]+)\*', r'\1', regex=True)
+    
+    # NBSP -> space, collapse whitespace, strip
+    texts = texts.str.replace('\u00A0', ' ', regex=False)
+    texts = texts.str.replace(r'\s+', ' ', regex=True)
+    
+    return texts.str.strip().fillna("")
+
+
 def preprocess_manifest(
     df: pd.DataFrame,
     min_duration: float = 0.5,
@@ -107,8 +128,8 @@ def preprocess_manifest(
     has_markdown = df['transcript'].str.contains(markdown_pattern, regex=True, na=False)
     stats['markdown_cleaned'] = has_markdown.sum()
     
-    df['transcript'] = df['transcript'].apply(clean_text)
-    df['translation'] = df['translation'].apply(clean_text)
+    df['transcript'] = clean_text_series(df['transcript'])
+    df['translation'] = clean_text_series(df['translation'])
     
     # Step 2: Filter empty transcripts
     empty_transcript = df['transcript'].str.len() < 1
@@ -8,15 +8,18 @@ print("=" * 60)
 print("MANIFEST DATA QUALITY ANALYSIS")
 print("=" * 60)
 
+# Text lengths (computed once, reused by the checks below)
+transcript_len = df['transcript'].str.len()
+
 # Empty or very short text
-empty_trans = df['transcript'].isna() | (df['transcript'].str.len() < 3)
+empty_trans = df['transcript'].isna() | (transcript_len < 3)
 empty_transl = df['translation'].isna() | (df['translation'].str.len() < 3)
 print(f'\n=== Empty/Very Short Text ===')
 print(f'Empty transcripts: {empty_trans.sum()}')
 print(f'Empty translations: {empty_transl.sum()}')
 
 # Short utterances
-short_interjection = df[(df['transcript'].str.len() < 10) & (df['transcript'].str.len() > 0)]
+short_interjection = df[(transcript_len < 10) & (transcript_len > 0)]
 print(f'\n=== Short Utterances (<10 chars) ===')
 print(f'Count: {len(short_interjection)}')
 print('Examples:')
@@ -41,12 +44,23 @@ if has_markdown.sum() > 0:
 # Duration distribution
 print(f'\n=== Duration Distribution ===')
 print(f'Total samples: {len(df)}')
-print(f'Too short (<0.5s): {len(df[df.duration < 0.5])}')
-print(f'Very short (0.5-1s): {len(df[(df.duration >= 0.5) & (df.duration < 1)])}')
-print(f'Short (1-3s): {len(df[(df.duration >= 1) & (df.duration < 3)])}')
-print(f'Medium (3-10s): {len(df[(df.duration >= 3) & (df.duration < 10)])}')
-print(f'Long (10-30s): {len(df[(df.duration >= 10) & (df.duration < 30)])}')
-print(f'Very long (>30s): {len(df[df.duration >= 30])}')
+# Single binning pass instead of one filtered DataFrame per bucket
+duration_labels = [
+    'Too short (<0.5s)',
+    'Very short (0.5-1s)',
+    'Short (1-3s)',
+    'Medium (3-10s)',
+    'Long (10-30s)',
+    'Very long (>30s)',
+]
+duration_buckets = pd.cut(
+    df['duration'],
+    bins=[float('-inf'), 0.5, 1, 3, 10, 30, float('inf')],
+    labels=duration_labels,
+    right=False,
+).value_counts()
+for label in duration_labels:
+    print(f'{label}: {duration_buckets[label]}')
 
 # Check for potential issues that need cleaning
 print(f'\n=== Text Quality Summary ===')
@@ -9,8 +9,9 @@ Usage:
 
 import argparse
 import json
+import os
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import matplotlib.pyplot as plt
 import matplotlib
@@ -25,13 +26,34 @@ plt.style.use('seaborn-v0_8-whitegrid')
 sns.set_palette("husl")
 
 
+METRICS_SUFFIX = "_metrics.json"
+
+
+def _scan_metrics_files(directory: Path) -> List[Tuple[str, str]]:
+    """
+    List (model_name, path) for *_metrics.json files in one os.scandir pass.
+    
+    DirEntry.is_file() uses the type from the directory listing, so no
+    extra stat() per entry; names are matched as plain strings. A missing
+    directory yields no files, as Path.glob did.
+    """
+    found = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(METRICS_SUFFIX) and entry.is_file():
+                    found.append((entry.name[:-len(METRICS_SUFFIX)], entry.path))
+    except FileNotFoundError:
+        pass
+    return found
+
+
 def load_metrics(results_dir: str) -> Dict[str, Dict]:
     """Load metrics from JSON files."""
     results_dir = Path(results_dir)
     metrics = {}
     
-    for metrics_file in results_dir.glob("*_metrics.json"):
-        model_name = metrics_file.stem.replace("_metrics", "")
+    for model_name, metrics_file in _scan_metrics_files(results_dir):
         with open(metrics_file, 'r') as f:
             metrics[model_name] = json.load(f)
     
@@ -44,8 +66,7 @@ def load_training_logs(logs_dir: str) -> Dict[str, pd.DataFrame]:
     logs = {}
     
     # Try JSON format first
-    for json_file in logs_dir.glob("*_metrics.json"):
-        model_name = json_file.stem.replace("_metrics", "")
+    for model_name, json_file in _scan_metrics_files(logs_dir):
         with open(json_file, 'r') as f:
             data = json.load(f)
         if isinstance(data, list):